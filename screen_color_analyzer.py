@@ -13,10 +13,12 @@ import sys
 import time
 import math
 import colorsys
+import functools
 import threading
 import logging
-from collections import deque
-from typing import List, Tuple, Optional, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict, deque
+from typing import List, Tuple, Optional, Dict, NamedTuple
 
 import tkinter as tk
 from tkinter import ttk
@@ -36,6 +38,21 @@ try:
 except ImportError:
     CV2_AVAILABLE = False
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# numba's on-disk cache needs the .py source, which a frozen (PyInstaller) build lacks
+_NUMBA_CACHE = not getattr(sys, "frozen", False)
+
+try:
+    from cykooz.resizer import FilterType, ImageData, PixelType, ResizeAlg, ResizeOptions, Resizer
+    RESIZER_AVAILABLE = True
+except ImportError:
+    RESIZER_AVAILABLE = False
+
 # Lamp control dependencies
 _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.join(_BASE_DIR, "smart_lamp_controller"))
@@ -57,6 +74,8 @@ logger = logging.getLogger(__name__)
 # Color Utilities
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Hex parsing is cached: the UI converts the same few colors every tick
+@functools.lru_cache(maxsize=4096)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     h = hex_color.lstrip("#")
     return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
@@ -70,11 +89,33 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
     )
 
 
+@functools.lru_cache(maxsize=4096)
 def hex_to_hsv(hex_color: str) -> Tuple[float, float, float]:
     r, g, b = hex_to_rgb(hex_color)
     return colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
 
 
+def rgb_array_to_hsv(rgb: np.ndarray) -> np.ndarray:
+    """Convert Nx3 RGB (0-255) to Nx3 HSV (0-1), bit-identical to colorsys.rgb_to_hsv."""
+    rgb = np.asarray(rgb, dtype=float) / 255.0
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    cmax = rgb.max(axis=1)
+    delta = cmax - rgb.min(axis=1)
+    safe_delta = np.where(delta > 0, delta, 1.0)
+
+    # Same operation order as colorsys so hues near 200/280 deg score the same
+    rc = (cmax - r) / safe_delta
+    gc = (cmax - g) / safe_delta
+    bc = (cmax - b) / safe_delta
+    s = np.where(cmax > 0, delta / np.where(cmax > 0, cmax, 1.0), 0.0)
+    h = np.select(
+        [delta == 0, cmax == r, cmax == g],
+        [0.0, bc - gc, 2.0 + rc - bc],
+        4.0 + gc - rc,
+    )
+    return np.stack([(h / 6.0) % 1.0, s, cmax], axis=-1)
+
+
 def luminance(r: int, g: int, b: int) -> float:
     return 0.2126 * r / 255 + 0.7152 * g / 255 + 0.0722 * b / 255
 
@@ -110,11 +151,32 @@ def is_colorful(r, g, b, min_sat=0.5, min_val=0.2, max_val=0.85):
     return True
 
 
+def is_colorful_mask(rgb: np.ndarray, min_sat=0.5, min_val=0.2, max_val=0.85) -> np.ndarray:
+    """Vectorized is_colorful over Nx3 RGB (0-255)."""
+    rgb = np.asarray(rgb, dtype=float)
+    hsv = rgb_array_to_hsv(rgb)
+    s, v = hsv[:, 1], hsv[:, 2]
+    avg = rgb.sum(axis=1) / (3 * 255)
+    var = (((rgb / 255) - avg[:, None]) ** 2).sum(axis=1) / 3
+    return (s >= min_sat) & (v >= min_val) & (v <= max_val) & ~((var < 0.02) & (avg > 0.6))
+
+
+def unpack_color_keys(keys: np.ndarray) -> np.ndarray:
+    """Unpack 9-bit quantized color keys (r3 g3 b3) to Nx3 RGB bin centers."""
+    return np.stack([((keys >> 6) << 5) | 16,
+                     (((keys >> 3) & 7) << 5) | 16,
+                     ((keys & 7) << 5) | 16], axis=-1)
+
+
 def is_skin_tone(r, g, b):
     rf, gf, bf = r / 255, g / 255, b / 255
     return rf > 0.6 and gf > 0.4 and bf > 0.2 and rf > gf > bf and (rf - bf) > 0.2
 
 
+# is_colorful for every quantized bin center, indexed by packed key
+IS_COLORFUL_LUT = is_colorful_mask(unpack_color_keys(np.arange(512))) if CAPTURE_AVAILABLE else None
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Color Scoring (mirrors color_selection_logic.py algorithm)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -211,47 +273,171 @@ def calculate_score_breakdown(hex_color: str, percentage: float) -> Dict:
     return result
 
 
+def calculate_score_breakdown_batch(hex_colors: List[str], percentages: List[float]) -> Dict[str, np.ndarray]:
+    """Score many colors at once; same numbers as calculate_score_breakdown, without reasons."""
+    rgb = np.array([hex_to_rgb(c) for c in hex_colors], dtype=float).reshape(-1, 3)
+    pct = np.asarray(percentages, dtype=float)
+    hsv = rgb_array_to_hsv(rgb)
+    s, v = hsv[:, 1], hsv[:, 2]
+    h_deg = hsv[:, 0] * 360
+
+    sat_score = s * 60 + np.where(s >= 0.7, 20, 0)
+    bri_score = np.select(
+        [(v > 0.25) & (v < 0.8), v < 0.15, v > 0.85],
+        [30.0, -50.0, -50.0],
+        np.maximum(0, 30 - np.abs(v - 0.525) * 80),
+    )
+    prev_score = np.where(pct > 3, np.minimum(pct * 2.5, 25), 0.0)
+    hue_score = np.select(
+        [(h_deg >= 200) & (h_deg < 280), (h_deg >= 280) & (h_deg < 340),
+         (h_deg < 60) | (h_deg >= 300), (h_deg >= 120) & (h_deg < 180)],
+        [20, 18, 15, 10],
+        8,
+    )
+
+    rf, gf, bf = rgb[:, 0] / 255, rgb[:, 1] / 255, rgb[:, 2] / 255
+    skin = (rf > 0.6) & (gf > 0.4) & (bf > 0.2) & (rf > gf) & (gf > bf) & ((rf - bf) > 0.2)
+    penalties = (np.where(skin, -40, 0) + np.where(s < 0.6, -15, 0)
+                 + np.where((s > 0.8) & (v > 0.3) & (v < 0.7), 15, 0))
+
+    total = sat_score + bri_score + prev_score + hue_score + penalties
+    rejected = (s < 0.5) | (total <= 0)
+    # Python's round(), as in the scalar version: np.round can differ on ties like 152.35
+    rounded = np.array([round(t, 1) for t in np.maximum(0, total).tolist()])
+    return {
+        "sat_score": np.where(s < 0.5, 0, sat_score),
+        "bri_score": bri_score,
+        "prev_score": prev_score,
+        "hue_score": hue_score,
+        "penalties": penalties,
+        "total": np.where(s < 0.5, 0, rounded),
+        "rejected": rejected,
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # HSV Color Map Generator
 # ═══════════════════════════════════════════════════════════════════════════════
 
+if NUMBA_AVAILABLE:
+    try:
+        @njit(parallel=True, cache=_NUMBA_CACHE)
+        def _colormap_jit(h_vals, s_vals, value):
+            """Single-pass HSV->RGB fill, one switch on the hue sector per pixel."""
+            height, width = s_vals.shape[0], h_vals.shape[0]
+            out = np.empty((height, width, 3), np.uint8)
+
+            # Hue terms depend on the column only: compute them once, not per row
+            sectors = np.empty(width, np.int64)
+            x_factor = np.empty(width)
+            for j in range(width):
+                h6 = h_vals[j] * 6.0
+                sectors[j] = int(h6)
+                x_factor[j] = 1 - abs(h6 % 2 - 1)
+
+            for i in prange(height):
+                c = value * s_vals[i]
+                m = value - c
+                for j in range(width):
+                    x = c * x_factor[j]
+                    sector = sectors[j]
+                    if sector == 0:
+                        r, g, b = c, x, 0.0
+                    elif sector == 1:
+                        r, g, b = x, c, 0.0
+                    elif sector == 2:
+                        r, g, b = 0.0, c, x
+                    elif sector == 3:
+                        r, g, b = 0.0, x, c
+                    elif sector == 4:
+                        r, g, b = x, 0.0, c
+                    else:
+                        r, g, b = c, 0.0, x
+                    out[i, j, 0] = np.uint8(min(max((r + m) * 255, 0.0), 255.0))
+                    out[i, j, 1] = np.uint8(min(max((g + m) * 255, 0.0), 255.0))
+                    out[i, j, 2] = np.uint8(min(max((b + m) * 255, 0.0), 255.0))
+            return out
+    except Exception as e:
+        # e.g. RuntimeError "no locator available" when the source file isn't shipped
+        logger.warning(f"numba JIT unavailable ({e}); using the NumPy path")
+        NUMBA_AVAILABLE = False
+
+
 def generate_colormap_array(width: int, height: int, value: float = 1.0) -> np.ndarray:
     """Generate an HSV color map as RGB numpy array. X=Hue, Y=Saturation."""
     h_vals = np.linspace(0, 1, width, endpoint=False)
     s_vals = np.linspace(1, 0, height)
-    H, S = np.meshgrid(h_vals, s_vals)
-    V = np.full_like(H, value)
-    C = V * S
-    H6 = H * 6.0
+    if NUMBA_AVAILABLE:
+        return _colormap_jit(h_vals, s_vals, float(value))
+
+    # Hue varies along columns and saturation along rows, so keep them as
+    # broadcastable (1, W) / (H, 1) views instead of materializing a meshgrid
+    H6 = h_vals[None, :] * 6.0
+    C = value * s_vals[:, None]
     X = C * (1 - np.abs(H6 % 2 - 1))
-    m = V - C
+    m = value - C
 
-    R, G, B = np.zeros_like(H), np.zeros_like(H), np.zeros_like(H)
+    # Write channels straight into one (H, W, 3) buffer instead of stacking
+    out = np.zeros((height, width, 3))
+    R, G, B = out[..., 0], out[..., 1], out[..., 2]
     for i, (lo, hi) in enumerate([(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6)]):
-        mask = (H6 >= lo) & (H6 < hi)
+        # Sector membership depends on hue only: select whole columns
+        cols = (H6[0] >= lo) & (H6[0] < hi)
+        Xs = X[:, cols]
         if i == 0:
-            R[mask], G[mask] = C[mask], X[mask]
+            R[:, cols], G[:, cols] = C, Xs
         elif i == 1:
-            R[mask], G[mask] = X[mask], C[mask]
+            R[:, cols], G[:, cols] = Xs, C
         elif i == 2:
-            G[mask], B[mask] = C[mask], X[mask]
+            G[:, cols], B[:, cols] = C, Xs
         elif i == 3:
-            G[mask], B[mask] = X[mask], C[mask]
+            G[:, cols], B[:, cols] = Xs, C
         elif i == 4:
-            R[mask], B[mask] = X[mask], C[mask]
+            R[:, cols], B[:, cols] = Xs, C
         elif i == 5:
-            R[mask], B[mask] = C[mask], X[mask]
-    R += m
-    G += m
-    B += m
-    rgb = np.stack([R, G, B], axis=-1)
-    return (rgb * 255).clip(0, 255).astype(np.uint8)
+            R[:, cols], B[:, cols] = C, Xs
+    out += m[..., None]
+    out *= 255
+    np.clip(out, 0, 255, out=out)
+    return out.astype(np.uint8)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Screen Capture Engine
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Downscaled frame size used for color analysis
+ANALYSIS_W, ANALYSIS_H = 64, 36
+
+# Largest frame kept for the UI preview (the analysis path only needs 64x36)
+PREVIEW_MAX_W, PREVIEW_MAX_H = 960, 540
+
+# cv2 uint8 HSV channel ranges (H: 0-180, S/V: 0-255)
+CV2_HSV_RANGE = (180.0, 255.0, 255.0)
+
+# Mean absolute per-channel difference (0-255) of the analysis frame below
+# which the screen is treated as static and the previous colors are reused
+FRAME_DIFF_THRESHOLD = 2.0
+
+# Row/column step of the preview sample compared on frames judged static
+PREVIEW_SAMPLE_STRIDE = 8
+
+
+class UiSnapshot(NamedTuple):
+    """Engine output state, read under a single lock acquisition per UI tick."""
+    frame: Optional[np.ndarray]
+    frame_seq: int
+    all_colors: List[Tuple[str, float]]
+    dominant_colors: List[Tuple[str, float]]
+    current_raw_hex: Optional[str]
+    current_smooth_hex: Optional[str]
+    would_send: bool
+    color_history: Optional[List[Tuple[float, str]]]  # None unless requested
+    send_events: Optional[List[float]]
+    new_data: bool
+    pending_lamp_color: Optional[str]
+
+
 class ScreenCaptureEngine:
     """Background screen capture and color extraction engine."""
 
@@ -269,8 +455,11 @@ class ScreenCaptureEngine:
         self.color_change_threshold = 0.02
 
         # Output state (read with lock)
-        self.latest_frame: Optional[np.ndarray] = None  # Full RGB frame
-        self.frame_size: Tuple[int, int] = (0, 0)  # (w, h)
+        # Preview-sized frame: C-contiguous uint8 (h, w, 4) in mss's BGRA order,
+        # which Pillow decodes directly with the "BGRX" raw mode
+        self.latest_frame: Optional[np.ndarray] = None
+        self.frame_seq: int = 0  # Incremented whenever latest_frame changes
+        self.frame_size: Tuple[int, int] = (0, 0)  # Captured (w, h)
         self.dominant_colors: List[Tuple[str, float]] = []  # Filtered (colorful)
         self.all_colors: List[Tuple[str, float]] = []  # Unfiltered top colors
         self.current_raw_hex: Optional[str] = None
@@ -282,11 +471,69 @@ class ScreenCaptureEngine:
         self.new_data: bool = False
         self.pending_lamp_color: Optional[str] = None  # set on threshold exceed
 
-        # Internal smoothing state
-        self._smooth_rgb = None
-        self._last_sent_rgb = None
+        # Internal smoothing state (fixed 3-vectors updated in place)
+        self._smooth_rgb = np.zeros(3)
+        self._last_sent_rgb = np.zeros(3)
+        self._delta_rgb = np.zeros(3)
+        self._has_smooth = False
+        self._has_sent = False
         self._last_send_time = 0
 
+        # Per-frame analysis buffers, reused to avoid allocator churn
+        n = ANALYSIS_W * ANALYSIS_H
+        self._small_bgra_buf = np.empty((ANALYSIS_H, ANALYSIS_W, 4), np.uint8)
+        self._small_buf = np.empty((ANALYSIS_H, ANALYSIS_W, 3), np.uint8)
+        self._mask_buf = np.empty(n, bool)
+
+        # Last analyzed frame and its results, for frame-diff gating
+        self._prev_small = np.empty((ANALYSIS_H, ANALYSIS_W, 3), np.uint8)
+        self._diff_buf = np.empty((ANALYSIS_H, ANALYSIS_W, 3), np.int16)
+        self._prev_key: Optional[Tuple[str, int]] = None
+        self._prev_raw_rgb: Tuple[int, int, int] = (0, 0, 0)
+
+        # Crop slices, recomputed only when the frame shape or crop changes
+        self._crop_key: Optional[tuple] = None
+        self._crop_slices: Tuple[slice, slice] = (slice(None), slice(None))
+
+    @property
+    def monitor_index(self) -> int:
+        """Index into mss monitors (0 = all monitors)."""
+        return self._monitor_index
+
+    @monitor_index.setter
+    def monitor_index(self, value: int):
+        self._monitor_index = value
+        self._monitor_dirty = True  # capture loop re-resolves the monitor
+
+    @property
+    def fps_limit(self) -> int:
+        """Maximum capture rate in frames per second."""
+        return self._fps_limit
+
+    @fps_limit.setter
+    def fps_limit(self, value: int):
+        self._fps_limit = value
+        self._frame_interval = 1.0 / max(value, 1)
+
+    def snapshot(self, consume: bool = False, history: bool = True) -> UiSnapshot:
+        """Copy the output state in one lock hold; consume clears new_data/pending_lamp_color.
+
+        history=False skips copying the history deques (left as None in the snapshot).
+        """
+        with self.lock:
+            snap = UiSnapshot(
+                self.latest_frame, self.frame_seq,
+                # Color lists are replaced, never mutated, so references suffice
+                self.all_colors, self.dominant_colors,
+                self.current_raw_hex, self.current_smooth_hex, self.would_send,
+                list(self.color_history) if history else None,
+                list(self.send_events) if history else None,
+                self.new_data, self.pending_lamp_color)
+            if consume:
+                self.new_data = False
+                self.pending_lamp_color = None
+        return snap
+
     def get_monitors(self) -> List[str]:
         """Return list of monitor descriptions."""
         try:
@@ -307,9 +554,10 @@ class ScreenCaptureEngine:
         if self.running:
             return
         self.running = True
-        self._smooth_rgb = None
-        self._last_sent_rgb = None
+        self._has_smooth = False
+        self._has_sent = False
         self._last_send_time = 0
+        self._prev_key = None
         self.thread = threading.Thread(target=self._capture_loop, daemon=True)
         self.thread.start()
 
@@ -320,17 +568,24 @@ class ScreenCaptureEngine:
         self.thread = None
 
     def _capture_loop(self):
+        fps_frames = 0
+        fps_elapsed = 0.0
+        mon = None
+        self._monitor_dirty = True
         with mss.mss() as sct:
             while self.running:
-                t0 = time.time()
+                t0 = time.perf_counter()
                 try:
-                    monitors = sct.monitors
-                    idx = min(self.monitor_index, len(monitors) - 1)
-                    mon = monitors[idx]
+                    if self._monitor_dirty:
+                        # Clear first so a change made meanwhile is picked up next frame
+                        self._monitor_dirty = False
+                        monitors = sct.monitors
+                        mon = monitors[min(self.monitor_index, len(monitors) - 1)]
                     raw = sct.grab(mon)
 
-                    # Convert BGRA -> RGB numpy array
-                    frame = np.array(raw)[:, :, :3][:, :, ::-1].copy()
+                    # Zero-copy BGRA view of mss's buffer; channels are
+                    # swapped only after downscaling
+                    frame = np.frombuffer(raw.raw, dtype=np.uint8).reshape(raw.height, raw.width, 4)
 
                     # Process
                     self._process_frame(frame)
@@ -340,76 +595,125 @@ class ScreenCaptureEngine:
                     time.sleep(0.5)
 
                 # FPS limiting
-                elapsed = time.time() - t0
-                target = 1.0 / max(self.fps_limit, 1)
+                elapsed = time.perf_counter() - t0
+                target = self._frame_interval
                 if elapsed < target:
                     time.sleep(target - elapsed)
-                total = time.time() - t0
-                self.fps_actual = 1.0 / max(total, 0.001)
+
+                # Refresh the measured rate every 8 frames
+                fps_elapsed += time.perf_counter() - t0
+                fps_frames += 1
+                if fps_frames == 8:
+                    self.fps_actual = fps_frames / max(fps_elapsed, 0.001)
+                    fps_frames = 0
+                    fps_elapsed = 0.0
 
     def _process_frame(self, frame: np.ndarray):
+        """Analyze one BGRA frame (h, w, 4) as returned by mss."""
         h, w = frame.shape[:2]
-        crop = self.crop_percent / 100.0
-        my = int(h * crop)
-        mx = int(w * crop)
-        cropped = frame[my : h - my, mx : w - mx] if my > 0 or mx > 0 else frame
+        crop_key = (h, w, self.crop_percent)
+        if crop_key != self._crop_key:
+            crop = crop_key[2] / 100.0
+            my = int(h * crop)
+            mx = int(w * crop)
+            self._crop_slices = (slice(my, h - my), slice(mx, w - mx))
+            self._crop_key = crop_key
+        cropped = frame[self._crop_slices]
 
         if cropped.size == 0:
             return
 
-        # Downscale for color analysis
-        small = self._downscale(cropped, 64, 36)
+        # Downscale for color analysis, then BGRA -> RGB on the small array
+        small_bgra = self._downscale(cropped, ANALYSIS_W, ANALYSIS_H, dst=self._small_bgra_buf)
+        small = self._small_buf
+        np.copyto(small, small_bgra[:, :, 2::-1])
+
+        # Keep only a preview-sized BGRA copy of the full frame for the UI;
+        # Pillow swaps channels in C when the preview image is built
+        scale = min(1.0, PREVIEW_MAX_W / w, PREVIEW_MAX_H / h)
+        preview = np.ascontiguousarray(
+            self._downscale(frame, max(1, int(w * scale)), max(1, int(h * scale))))
+
+        key = (self.mode, self.crop_percent)
+        static = key == self._prev_key and not self._frame_changed(small)
+        if static:
+            # Static screen: reuse the last analysis, only smoothing advances
+            all_cols, dom_cols = self.all_colors, self.dominant_colors
+            raw_rgb = self._prev_raw_rgb
+        else:
+            # Extract dominant colors (unfiltered + filtered)
+            all_cols, dom_cols = self._extract_dominant(small, num_all=10, num_colorful=8)
 
-        # Extract dominant colors (unfiltered + filtered)
-        all_cols = self._extract_dominant(small, num=10, filter_colorful=False)
-        dom_cols = self._extract_dominant(small, num=8, filter_colorful=True)
+            # Extract output color
+            raw_rgb = self._extract_output_color(small)
 
-        # Extract output color
-        raw_rgb = self._extract_output_color(small)
+            np.copyto(self._prev_small, small)
+            self._prev_key = key
+            self._prev_raw_rgb = raw_rgb
         raw_hex = rgb_to_hex(*raw_rgb)
 
-        # Adaptive smoothing — react fast to big changes, smooth over small ones
-        if self._smooth_rgb is None:
-            self._smooth_rgb = np.array(raw_rgb, dtype=float)
+        # Adaptive smoothing — react fast to big changes, smooth over small ones.
+        # Distances are compared squared (0-255 scale) to skip the sqrt.
+        delta = self._delta_rgb
+        if not self._has_smooth:
+            self._smooth_rgb[:] = raw_rgb
+            self._has_smooth = True
         else:
-            raw_arr = np.array(raw_rgb, dtype=float)
-            jump = np.sqrt(np.sum(((raw_arr - self._smooth_rgb) / 255) ** 2))
-            if jump > 0.15:
+            np.subtract(raw_rgb, self._smooth_rgb, out=delta)
+            jump_sq = delta.dot(delta)
+            if jump_sq > (0.15 * 255) ** 2:
                 # Large color shift: snap quickly
                 a = min(0.85, self.alpha * 3.0)
-            elif jump > 0.08:
+            elif jump_sq > (0.08 * 255) ** 2:
                 # Medium shift: accelerate tracking
                 a = min(0.6, self.alpha * 2.0)
             else:
                 a = self.alpha
-            self._smooth_rgb = a * raw_arr + (1 - a) * self._smooth_rgb
-        sr, sg, sb = self._smooth_rgb.astype(int).clip(0, 255)
+            # In-place EMA: smooth += a * (raw - smooth)
+            delta *= a
+            self._smooth_rgb += delta
+        sr, sg, sb = self._smooth_rgb.tolist()
         smooth_hex = rgb_to_hex(int(sr), int(sg), int(sb))
 
         # Threshold check with stale timer for gradual drifts
         now = time.time()
         would_send = False
-        if self._last_sent_rgb is not None:
-            diff = np.sqrt(np.sum(((self._smooth_rgb - self._last_sent_rgb) / 255) ** 2))
-            if diff > self.color_change_threshold:
+        if self._has_sent:
+            np.subtract(self._smooth_rgb, self._last_sent_rgb, out=delta)
+            diff_sq = delta.dot(delta)
+            threshold = self.color_change_threshold * 255
+            if diff_sq > threshold * threshold:
                 would_send = True
             elif (now - self._last_send_time) > 0.2:
                 # 200ms stale: catch slow drifts that never exceed threshold in one step
-                if diff > self.color_change_threshold * 0.3:
+                if diff_sq > (threshold * 0.3) ** 2:
                     would_send = True
             if would_send:
-                self._last_sent_rgb = self._smooth_rgb.copy()
+                self._last_sent_rgb[:] = self._smooth_rgb
                 self._last_send_time = now
                 self.send_events.append(now)
         else:
-            self._last_sent_rgb = self._smooth_rgb.copy()
+            self._last_sent_rgb[:] = self._smooth_rgb
+            self._has_sent = True
             self._last_send_time = now
             would_send = True
             self.send_events.append(now)
         self.color_history.append((now, smooth_hex))
 
+        # Only publish (and bump frame_seq for) previews that actually changed.
+        # A changed analysis frame settles it; otherwise compare a strided
+        # sample, which also catches changes outside the crop area
+        prev = self.latest_frame
+        if prev is None or not static or prev.shape != preview.shape:
+            preview_changed = True
+        else:
+            step = PREVIEW_SAMPLE_STRIDE
+            preview_changed = not np.array_equal(preview[::step, ::step], prev[::step, ::step])
+
         with self.lock:
-            self.latest_frame = frame
+            if preview_changed:
+                self.latest_frame = preview
+                self.frame_seq += 1
             self.frame_size = (w, h)
             self.all_colors = all_cols
             self.dominant_colors = dom_cols
@@ -420,90 +724,109 @@ class ScreenCaptureEngine:
                 self.pending_lamp_color = smooth_hex
             self.new_data = True
 
-    def _downscale(self, img: np.ndarray, tw: int, th: int) -> np.ndarray:
-        if CV2_AVAILABLE:
-            return cv2.resize(img, (tw, th), interpolation=cv2.INTER_AREA)
-        pil = Image.fromarray(img)
-        pil = pil.resize((tw, th), Image.LANCZOS)
-        return np.array(pil)
+    def _frame_changed(self, small: np.ndarray) -> bool:
+        """True if small differs enough from the last analyzed frame."""
+        diff = self._diff_buf
+        np.subtract(small, self._prev_small, out=diff, dtype=np.int16)
+        np.abs(diff, out=diff)
+        return diff.mean() >= FRAME_DIFF_THRESHOLD
 
-    def _extract_dominant(self, small: np.ndarray, num=8, filter_colorful=True) -> List[Tuple[str, float]]:
+    def _downscale(self, img: np.ndarray, tw: int, th: int,
+                   dst: Optional[np.ndarray] = None) -> np.ndarray:
+        if CV2_AVAILABLE:
+            return cv2.resize(img, (tw, th), dst=dst, interpolation=cv2.INTER_AREA)
+        # Decode BGRX like the preview path: Image.fromarray would read the
+        # frame as RGBA, swapping red/blue and weighting pixels by the pad byte
+        h, w = img.shape[:2]
+        pil = Image.frombuffer("RGB", (w, h), np.ascontiguousarray(img), "raw", "BGRX", 0, 1)
+        rgb = np.asarray(pil.resize((tw, th), Image.LANCZOS))
+        if dst is None:
+            dst = np.empty((th, tw, 4), np.uint8)
+        # Back to the BGRA layout the callers expect
+        dst[..., :3] = rgb[..., ::-1]
+        dst[..., 3] = 255
+        return dst
+
+    def _extract_dominant(self, small: np.ndarray, num_all=10,
+                          num_colorful=8) -> Tuple[List[Tuple[str, float]], List[Tuple[str, float]]]:
+        """Return (top colors, top colorful colors) from a single quantize/count pass."""
         pixels = small.reshape(-1, 3)
-        quantized = (pixels // 32) * 32 + 16
-        # Count unique
-        uniq, counts = np.unique(quantized, axis=0, return_counts=True)
+        # Quantize to 8 levels per channel and pack into a 9-bit key (r3 g3 b3).
+        # Only the red term needs widening; g3 << 3 still fits in uint8.
+        q = pixels >> 5
+        keys = (q[:, 0].astype(np.uint16) << 6) | (q[:, 1] << 3) | q[:, 2]
+        counts = np.bincount(keys, minlength=512)
         total = counts.sum()
-        order = counts.argsort()[::-1]
-        uniq = uniq[order]
-        counts = counts[order]
-
-        result = []
-        for i in range(len(uniq)):
-            r, g, b = int(uniq[i][0]), int(uniq[i][1]), int(uniq[i][2])
-            pct = float(counts[i]) / total * 100
-            if filter_colorful and not is_colorful(r, g, b):
-                continue
-            result.append((rgb_to_hex(r, g, b), round(pct, 1)))
-            if len(result) >= num:
-                break
-        return result
+        order = np.argsort(-counts, kind="stable")[:np.count_nonzero(counts)]
+
+        centers = unpack_color_keys(order)
+        def _as_list(keys, rgb, num):
+            return [(rgb_to_hex(r, g, b), round(float(counts[key]) / total * 100, 1))
+                    for key, (r, g, b) in zip(keys[:num].tolist(), rgb[:num].tolist())]
+
+        keep = IS_COLORFUL_LUT[order]
+        return (_as_list(order, centers, num_all),
+                _as_list(order[keep], centers[keep], num_colorful))
 
     def _pixels_to_hsv(self, pixels_flat: np.ndarray) -> np.ndarray:
-        """Convert Nx3 RGB float pixels (0-255) to Nx3 HSV (0-1). Uses cv2 fast path if available."""
+        """Convert Nx3 uint8 RGB pixels to Nx3 HSV (0-1). Uses cv2 fast path if available."""
         if CV2_AVAILABLE:
-            # cv2 expects uint8 BGR
-            bgr = pixels_flat[:, ::-1].astype(np.uint8).reshape(1, -1, 3)
-            hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV).reshape(-1, 3).astype(float)
-            hsv[:, 0] /= 180.0  # H: 0-180 -> 0-1
-            hsv[:, 1] /= 255.0  # S: 0-255 -> 0-1
-            hsv[:, 2] /= 255.0  # V: 0-255 -> 0-1
-            return hsv
-        return np.array([colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
-                         for r, g, b in pixels_flat])
+            hsv = cv2.cvtColor(np.ascontiguousarray(pixels_flat).reshape(1, -1, 3), cv2.COLOR_RGB2HSV)
+            return np.divide(hsv.reshape(-1, 3), CV2_HSV_RANGE)
+        return rgb_array_to_hsv(pixels_flat)
+
+    def _vs_mask(self, pixels: np.ndarray, v: np.ndarray, min_v: int, min_s: int) -> np.ndarray:
+        """Mask of pixels with V > min_v and S > min_s (0-255 scale).
+
+        Saturation is only computed for the pixels that pass the V test, since
+        dark UI chrome usually makes up most of the frame.
+        """
+        mask = np.greater(v, min_v, out=self._mask_buf if len(v) == len(self._mask_buf) else None)
+        idx = np.flatnonzero(mask)
+        v_sel = v[idx].astype(np.int32)
+        delta = v_sel - pixels[idx].min(axis=1)
+        # S = delta / V  >  min_s / 255, kept in integers
+        mask[idx] = delta * 255 > min_s * v_sel
+        return mask
 
     def _extract_output_color(self, small: np.ndarray) -> Tuple[int, int, int]:
         """Extract the output color using average or accent mode."""
-        pixels = small.reshape(-1, 3).astype(float)
-        hsv_pixels = self._pixels_to_hsv(pixels)
+        pixels = small.reshape(-1, 3)
+        v = pixels.max(axis=1)
 
         if self.mode == "average":
             # Filter dark/desaturated pixels
-            mask = (hsv_pixels[:, 2] > 30 / 255) & (hsv_pixels[:, 1] > 20 / 255)
+            mask = self._vs_mask(pixels, v, 30, 20)
             if mask.sum() == 0:
                 return (128, 128, 128)
             avg = pixels[mask].mean(axis=0)
             return (int(avg[0]), int(avg[1]), int(avg[2]))
 
         else:  # accent
-            mask = (hsv_pixels[:, 2] > 40 / 255) & (hsv_pixels[:, 1] > 50 / 255)
+            mask = self._vs_mask(pixels, v, 40, 50)
             if mask.sum() == 0:
                 # Fallback to less strict
-                mask = (hsv_pixels[:, 2] > 30 / 255) & (hsv_pixels[:, 1] > 20 / 255)
+                mask = self._vs_mask(pixels, v, 30, 20)
             if mask.sum() == 0:
                 return (128, 128, 128)
 
+            # Full HSV only for the surviving accent pixels
+            accent_pixels = pixels[mask]
+            hsv_pixels = self._pixels_to_hsv(accent_pixels)
+
             # Hue histogram (18 bins)
-            hues = hsv_pixels[mask, 0]
-            hist, edges = np.histogram(hues, bins=18, range=(0, 1))
+            hues = hsv_pixels[:, 0]
+            hue_bins = np.minimum((hues * 18).astype(np.intp), 17)
+            hist = np.bincount(hue_bins, minlength=18)
             dominant_bin = hist.argmax()
-            bin_lo = edges[dominant_bin]
-            bin_hi = edges[dominant_bin + 1]
 
-            # Average pixels in dominant hue bin
-            hue_mask = (hues >= bin_lo) & (hues < bin_hi)
-            sat_vals = hsv_pixels[mask][hue_mask]
-            rgb_vals = pixels[mask][hue_mask]
-
-            if len(rgb_vals) == 0:
-                avg = pixels[mask].mean(axis=0)
-                return (int(avg[0]), int(avg[1]), int(avg[2]))
+            # Average HSV of the dominant hue bin: one gather, one reduction.
+            # The bin is never empty (argmax of a non-empty histogram), and
+            # only HSV is needed, so the RGB pixels are not gathered.
+            avg_h, avg_s, avg_v = hsv_pixels[hue_bins == dominant_bin].mean(axis=0)
 
             # Boost saturation for accent
-            dominance = hist[dominant_bin] / mask.sum()
-            avg_rgb = rgb_vals.mean(axis=0)
-            avg_h = sat_vals[:, 0].mean()
-            avg_s = sat_vals[:, 1].mean()
-            avg_v = sat_vals[:, 2].mean()
+            dominance = hist[dominant_bin] / len(accent_pixels)
 
             if dominance > 0.3:
                 target_s = 1.0
@@ -527,6 +850,11 @@ COLORMAP_W, COLORMAP_H = 340, 170
 HISTORY_H = 70
 SIM_SIZE = 80
 
+# UI refresh cadence: the loop ticks every UI_TICK_MS, heavier panels every Nth tick
+UI_TICK_MS = 33
+PANELS_EVERY = 2   # preview, colors, colormap markers (~15 Hz)
+HISTORY_EVERY = 3  # history timeline (~10 Hz)
+
 
 class ScreenColorAnalyzerApp:
     def __init__(self, root: tk.Tk):
@@ -538,8 +866,55 @@ class ScreenColorAnalyzerApp:
         self.engine = ScreenCaptureEngine()
         self.selected_color: Optional[str] = None
         self._preview_photo = None  # prevent GC
+
+        # SIMD preview resizer (cykooz.resizer), destination reused per size
+        self._resizer = Resizer() if RESIZER_AVAILABLE else None
+        self._resize_dst: Optional[object] = None
+
+        # UI tick counter and per-panel redraw state
+        self._tick = 0
+        self._panels_dirty = False
+        self._markers_key: Optional[tuple] = None
+
+        # Persistent canvas items: preview image, lamp simulation (glow, body)
+        self._preview_item: Optional[int] = None
+        self._sim_items: Optional[Tuple[int, int]] = None
+
+        # Last simulation colors and send indicator shown, to skip repeats
+        self._sim_last: Optional[Tuple[str, str]] = None
+        self._sim_send_state: Optional[Tuple[str, str]] = None
+
+        # Lamp simulation glow images, LRU by smoothed color
+        self._sim_glow_cache: "OrderedDict[str, ImageTk.PhotoImage]" = OrderedDict()
+
+        # History timeline image
+        self._history_photo = None
+
+        # Prevalence bar image and the (width, colors) it was drawn for
+        self._prevalence_photo = None
+        self._prevalence_key: Optional[tuple] = None
+
+        # Last rendered (frame_seq, canvas w, canvas h, crop), to skip redundant redraws
+        self._preview_render_key: Optional[tuple] = None
+
+        # Preview rendering worker (single slot) and a request deferred while busy
+        self._preview_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview")
+        self._preview_future: Optional[Future] = None
+        self._preview_retry: Optional[tuple] = None
+
+        # Frame currently shown in the preview, sampled by click/hover
+        self._preview_frame: Optional[np.ndarray] = None
+        self._motion_last_ts = 0.0
+
+        # Crop overlay, cached per (preview w, h, crop)
+        self._overlay_key: Optional[tuple] = None
+        self._overlay_img: Optional["Image.Image"] = None
+
         self._colormap_base_photo = None
         self._colormap_value = 0.85
+        self._colormap_v1: Optional[np.ndarray] = None  # V=1 colormap, scaled per brightness
+        self._colormap_buf: Optional[np.ndarray] = None
+        self._colormap_u8: Optional[np.ndarray] = None
 
         # Lamp connection state
         self.device_manager: Optional[object] = None
@@ -712,6 +1087,8 @@ class ScreenColorAnalyzerApp:
 
             bar_canvas = tk.Canvas(row_frame, height=18, bg="#222", highlightthickness=0)
             bar_canvas.grid(row=0, column=2, sticky="ew", padx=(0, 4))
+            # Single persistent bar, resized via coords()
+            bar_id = bar_canvas.create_rectangle(0, 0, 0, 18, fill="#222", outline="")
 
             pct_lbl = ttk.Label(row_frame, text="", font=("Consolas", 9), width=6)
             pct_lbl.grid(row=0, column=3)
@@ -720,8 +1097,8 @@ class ScreenColorAnalyzerApp:
             score_lbl.grid(row=0, column=4, padx=(2, 0))
 
             item = {"frame": row_frame, "swatch": swatch, "hex_lbl": hex_lbl,
-                    "bar_canvas": bar_canvas, "pct_lbl": pct_lbl, "score_lbl": score_lbl,
-                    "hex": None}
+                    "bar_canvas": bar_canvas, "bar_id": bar_id, "pct_lbl": pct_lbl,
+                    "score_lbl": score_lbl, "hex": None, "state": None}
             # Click to select
             for widget in (row_frame, swatch, hex_lbl, bar_canvas, pct_lbl, score_lbl):
                 widget.bind("<Button-1>", lambda e, idx=i: self._on_color_item_click(idx))
@@ -863,121 +1240,247 @@ class ScreenColorAnalyzerApp:
     def _generate_colormap(self):
         cw = self.colormap_canvas.winfo_reqwidth() or COLORMAP_W
         ch = self.colormap_canvas.winfo_reqheight() or COLORMAP_H
-        arr = generate_colormap_array(cw, ch, self._colormap_value)
-        img = Image.fromarray(arr)
+        # HSV->RGB is linear in V, so build the V=1 map once per size and scale it
+        if self._colormap_v1 is None or self._colormap_v1.shape[:2] != (ch, cw):
+            self._colormap_v1 = generate_colormap_array(cw, ch, 1.0)
+            self._colormap_buf = np.empty(self._colormap_v1.shape, np.uint16)
+            self._colormap_u8 = np.empty(self._colormap_v1.shape, np.uint8)
+        buf = self._colormap_buf
+        np.multiply(self._colormap_v1, int(round(self._colormap_value * 256)),
+                    out=buf, dtype=np.uint16)
+        # Shift straight into the persistent uint8 map (no astype temporary)
+        np.right_shift(buf, 8, out=self._colormap_u8, casting="unsafe")
+        img = Image.frombuffer("RGB", (cw, ch), self._colormap_u8, "raw", "RGB", 0, 1)
+
+        if self._colormap_base_photo is not None and (
+                self._colormap_base_photo.width(), self._colormap_base_photo.height()) == img.size:
+            self._colormap_base_photo.paste(img)
+            return
         self._colormap_base_photo = ImageTk.PhotoImage(img)
         self.colormap_canvas.delete("all")
         self.colormap_canvas.create_image(0, 0, anchor="nw", image=self._colormap_base_photo)
+        self._markers_key = None  # markers were cleared with the map
 
     # ── Main Update Loop ─────────────────────────────────────────────────
 
     def _update_loop(self):
+        self._tick += 1
         if self.engine.running:
-            with self.engine.lock:
-                has_data = self.engine.new_data
-                self.engine.new_data = False
-                lamp_color = self.engine.pending_lamp_color
-                self.engine.pending_lamp_color = None
-
-            if has_data:
-                self._update_preview()
-                self._update_colors()
-                self._update_colormap_markers()
-                self._update_simulation()
+            # The history deques are only copied on ticks that draw them
+            draw_history = self._tick % HISTORY_EVERY == 0
+            snap = self.engine.snapshot(consume=True, history=draw_history)
+            lamp_color = snap.pending_lamp_color
+
+            # The lamp simulation tracks every new frame; the heavier panels
+            # catch up on their own, slower cadence
+            if snap.new_data:
+                self._panels_dirty = True
+                self._update_simulation(snap)
+            if self._panels_dirty and self._tick % PANELS_EVERY == 0:
+                self._panels_dirty = False
+                self._update_preview(snap)
+                self._update_colors(snap)
+                self._update_colormap_markers(snap)
 
             # Send color to lamp if enabled
             if lamp_color and self.lamp_send_enabled and self.lamp_connected:
                 self._send_color_to_lamp(lamp_color)
 
-            self._update_history()
+            if draw_history:
+                self._update_history(snap)
             self.fps_var.set(f"FPS: {self.engine.fps_actual:.1f}")
             self.status_var.set("Running")
         else:
             self.status_var.set("Stopped")
 
-        self.root.after(33, self._update_loop)
+        self.root.after(UI_TICK_MS, self._update_loop)
 
     # ── UI Update Methods ────────────────────────────────────────────────
 
-    def _update_preview(self):
-        with self.engine.lock:
-            frame = self.engine.latest_frame
+    def _update_preview(self, snap: Optional[UiSnapshot] = None, resample=None):
+        """Render the latest frame; live updates use BILINEAR unless resample is given."""
+        snap = snap or self.engine.snapshot()
+        frame, frame_seq = snap.frame, snap.frame_seq
         if frame is None:
             return
 
-        h, w = frame.shape[:2]
         canvas_w = max(self.preview_canvas.winfo_width(), PREVIEW_W)
         canvas_h = max(self.preview_canvas.winfo_height(), PREVIEW_H)
 
+        # Nothing to redraw if the frame, canvas size and crop are all unchanged
+        render_key = (frame_seq, canvas_w, canvas_h, self.engine.crop_percent)
+        if resample is None and render_key == self._preview_render_key:
+            return
+
+        # One render in flight at a time; a busy worker retries once it is done
+        if self._preview_future is not None and not self._preview_future.done():
+            self._preview_retry = (resample,)
+            return
+        self._preview_render_key = render_key
+
+        # Resize and overlay on the worker; only the PhotoImage update runs on Tk
+        crop = self.engine.crop_percent / 100.0
+        future = self._preview_executor.submit(
+            self._prepare_preview_image, frame, canvas_w, canvas_h, crop, resample)
+        self._preview_future = future
+        future.add_done_callback(self._on_preview_ready)
+
+    def _prepare_preview_image(self, frame: np.ndarray, canvas_w: int, canvas_h: int,
+                               crop: float, resample=None) -> tuple:
+        """Worker thread: fit the frame to the canvas and blend the crop overlay."""
+        assert frame.dtype == np.uint8 and frame.shape[2] == 4 and frame.flags.c_contiguous
+        h, w = frame.shape[:2]
+
         # Fit to canvas
         scale = min(canvas_w / w, canvas_h / h)
         new_w = int(w * scale)
         new_h = int(h * scale)
 
-        img = Image.fromarray(frame)
-        img = img.resize((new_w, new_h), Image.LANCZOS)
+        img = None
+        if self._resizer is not None and resample is None and (new_w, new_h) != (w, h):
+            try:
+                img = self._fast_resize(frame, new_w, new_h)
+            except Exception as e:
+                # Incompatible cykooz.resizer build: fall back to Pillow for good
+                logger.warning(f"cykooz.resizer failed ({e}); using Pillow for the preview")
+                self._resizer = None
+
+        if img is None:
+            # Already preview-sized frames are just decoded, no resampling pass
+            img = Image.frombuffer("RGB", (w, h), frame, "raw", "BGRX", 0, 1)
+        if img.size != (new_w, new_h):
+            if resample is None:
+                # Box-reduce by the largest power-of-two factor that still leaves
+                # room to shrink, so the bilinear pass only touches a few pixels
+                factor = min(w // new_w, h // new_h)
+                if factor >= 2:
+                    img = img.reduce(1 << (factor.bit_length() - 1))
+            # Bilinear is plenty for a monitoring preview and much cheaper than LANCZOS
+            img = img.resize((new_w, new_h), resample or Image.BILINEAR)
+
+        # Draw crop overlay (blended in place through its own alpha channel)
+        if crop > 0:
+            overlay = self._get_crop_overlay(new_w, new_h, crop)
+            img.paste(overlay, (0, 0), overlay)
 
-        # Draw crop overlay
-        crop = self.engine.crop_percent / 100.0
-        my = int(new_h * crop)
-        mx = int(new_w * crop)
+        return img, frame, canvas_w, canvas_h, scale
 
-        if crop > 0:
-            overlay = Image.new("RGBA", (new_w, new_h), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(overlay)
-            dark = (0, 0, 0, 120)
-            # Top
-            draw.rectangle([0, 0, new_w, my], fill=dark)
-            # Bottom
-            draw.rectangle([0, new_h - my, new_w, new_h], fill=dark)
-            # Left
-            draw.rectangle([0, my, mx, new_h - my], fill=dark)
-            # Right
-            draw.rectangle([new_w - mx, my, new_w, new_h - my], fill=dark)
-            # Border around active area
-            draw.rectangle([mx, my, new_w - mx - 1, new_h - my - 1],
-                           outline=(255, 220, 0, 200), width=2)
-
-            img_rgba = img.convert("RGBA")
-            img = Image.alpha_composite(img_rgba, overlay).convert("RGB")
-
-        self._preview_photo = ImageTk.PhotoImage(img)
-        self.preview_canvas.delete("all")
+    def _on_preview_ready(self, future: Future):
+        """Worker thread: hand the finished preview back to the Tk thread."""
+        try:
+            self.root.after(0, self._finalize_preview, future)
+        except (RuntimeError, tk.TclError):
+            pass  # window already closed
+
+    def _finalize_preview(self, future: Future):
+        try:
+            img, frame, canvas_w, canvas_h, scale = future.result()
+        except Exception as e:
+            logger.error(f"Preview render error: {e}")
+            return
+
+        # Reuse the Tk photo image while the preview size is stable
+        if self._preview_photo is None or (self._preview_photo.width(),
+                                           self._preview_photo.height()) != img.size:
+            self._preview_photo = ImageTk.PhotoImage(img)
+        else:
+            self._preview_photo.paste(img)
+        new_w, new_h = img.size
         ox = (canvas_w - new_w) // 2
         oy = (canvas_h - new_h) // 2
-        self.preview_canvas.create_image(ox, oy, anchor="nw", image=self._preview_photo)
+        if self._preview_item is None:
+            self.preview_canvas.delete("all")  # placeholder text
+            self._preview_item = self.preview_canvas.create_image(
+                ox, oy, anchor="nw", image=self._preview_photo)
+        else:
+            self.preview_canvas.itemconfigure(self._preview_item, image=self._preview_photo)
+            self.preview_canvas.coords(self._preview_item, ox, oy)
 
         # Store mapping for click sampling
+        h, w = frame.shape[:2]
         self._preview_offset = (ox, oy)
         self._preview_scale = scale
         self._preview_img_size = (w, h)
+        # The engine publishes a new array per frame and never writes into an
+        # old one, so the displayed frame can be sampled later without the lock
+        self._preview_frame = frame
+
+        # A request that arrived while this render was busy
+        if self._preview_retry is not None:
+            (resample,) = self._preview_retry
+            self._preview_retry = None
+            self._update_preview(resample=resample)
+
+    def _get_crop_overlay(self, w: int, h: int, crop: float) -> "Image.Image":
+        """Return the RGBA crop overlay for this preview size, rebuilt only on change."""
+        key = (w, h, crop)
+        if key == self._overlay_key:
+            return self._overlay_img
 
-    def _update_colors(self):
-        with self.engine.lock:
-            all_cols = list(self.engine.all_colors)
-            dom_cols = list(self.engine.dominant_colors)
+        my = int(h * crop)
+        mx = int(w * crop)
+        overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+        dark = (0, 0, 0, 120)
+        # Top
+        draw.rectangle([0, 0, w, my], fill=dark)
+        # Bottom
+        draw.rectangle([0, h - my, w, h], fill=dark)
+        # Left
+        draw.rectangle([0, my, mx, h - my], fill=dark)
+        # Right
+        draw.rectangle([w - mx, my, w, h - my], fill=dark)
+        # Border around active area
+        draw.rectangle([mx, my, w - mx - 1, h - my - 1],
+                       outline=(255, 220, 0, 200), width=2)
+
+        self._overlay_key = key
+        self._overlay_img = overlay
+        return overlay
+
+    def _fast_resize(self, frame: np.ndarray, new_w: int, new_h: int) -> "Image.Image":
+        """Bilinear-resize a BGRA frame with cykooz.resizer; channel order is irrelevant."""
+        h, w = frame.shape[:2]
+        dst = self._resize_dst
+        if dst is None or (dst.width, dst.height) != (new_w, new_h):
+            dst = self._resize_dst = ImageData(new_w, new_h, PixelType.U8x4)
+        src = ImageData(w, h, PixelType.U8x4, memoryview(frame).cast("B"))
+        # mss alpha is always opaque, so skip the premultiply/unpremultiply passes
+        self._resizer.resize(src, dst, ResizeOptions(
+            resize_alg=ResizeAlg.convolution(FilterType.bilinear), use_alpha=False))
+        return Image.frombuffer("RGB", (new_w, new_h), dst.get_buffer(), "raw", "BGRX", 0, 1)
 
-        # Prevalence stacked bar
-        self.prevalence_canvas.delete("all")
-        cw = max(self.prevalence_canvas.winfo_width(), 200)
-        ch = 28
-        x = 0
-        total_pct = sum(pct for _, pct in all_cols)
-        for hex_color, pct in all_cols:
-            w = max(1, int(pct / max(total_pct, 1) * cw))
-            self.prevalence_canvas.create_rectangle(x, 0, x + w, ch, fill=hex_color, outline="")
-            x += w
-        if x < cw:
-            self.prevalence_canvas.create_rectangle(x, 0, cw, ch, fill="#333333", outline="")
+    def _update_colors(self, snap: UiSnapshot):
+        all_cols = snap.all_colors
+        dom_cols = snap.dominant_colors
+
+        self._draw_prevalence_bar(all_cols)
 
         # Accent colors list
         max_pct = max((pct for _, pct in dom_cols), default=1)
+        totals = calculate_score_breakdown_batch(
+            [c for c, _ in dom_cols], [p for _, p in dom_cols])["total"] if dom_cols else []
         for i, item in enumerate(self._color_widgets):
             if i < len(dom_cols):
                 hex_color, pct = dom_cols[i]
-                score_info = calculate_score_breakdown(hex_color, pct)
-                item["hex"] = hex_color
+                bar_w = max(item["bar_canvas"].winfo_width(), 80)
+                fill_w = int(pct / max(max_pct, 1) * bar_w)
+                total = float(totals[i])
+                tag = "good" if total >= 60 else ("ok" if total >= 30 else "bad")
+                score_text = f"S:{total:.0f}"
+            else:
+                hex_color = pct = None
+                fill_w = 0
+                tag = score_text = None
 
+            # Only touch the row's widgets when what they show has changed
+            state = (hex_color, pct, fill_w, score_text, tag)
+            if state == item["state"]:
+                continue
+            item["state"] = state
+            item["hex"] = hex_color
+
+            if hex_color is not None:
                 # Swatch
                 item["swatch"].configure(bg=hex_color)
 
@@ -985,40 +1488,67 @@ class ScreenColorAnalyzerApp:
                 item["hex_lbl"].configure(text=hex_color)
 
                 # Proportion bar
-                bar_w = max(item["bar_canvas"].winfo_width(), 80)
-                item["bar_canvas"].delete("all")
-                fill_w = int(pct / max(max_pct, 1) * bar_w)
-                item["bar_canvas"].create_rectangle(0, 0, fill_w, 18,
-                                                    fill=hex_color, outline="")
+                item["bar_canvas"].coords(item["bar_id"], 0, 0, fill_w, 18)
+                item["bar_canvas"].itemconfigure(item["bar_id"], fill=hex_color)
 
                 # Percentage
                 item["pct_lbl"].configure(text=f"{pct:.1f}%")
 
                 # Score
-                total = score_info["total"]
-                tag = "good" if total >= 60 else ("ok" if total >= 30 else "bad")
                 color = {"good": "#50fa7b", "ok": "#f1fa8c", "bad": "#ff5555"}[tag]
-                item["score_lbl"].configure(text=f"S:{total:.0f}", foreground=color)
+                item["score_lbl"].configure(text=score_text, foreground=color)
 
                 item["frame"].grid()
             else:
-                item["hex"] = None
                 item["swatch"].configure(bg="#333")
                 item["hex_lbl"].configure(text="")
-                item["bar_canvas"].delete("all")
+                item["bar_canvas"].coords(item["bar_id"], 0, 0, 0, 18)
                 item["pct_lbl"].configure(text="")
                 item["score_lbl"].configure(text="")
                 item["frame"].grid_remove()
 
-    def _update_colormap_markers(self):
-        self.colormap_canvas.delete("marker")
-        with self.engine.lock:
-            dom_cols = list(self.engine.dominant_colors)
-            smooth = self.engine.current_smooth_hex
+    def _draw_prevalence_bar(self, all_cols: List[Tuple[str, float]]):
+        """Draw the stacked prevalence bar as a single image instead of one rect per color."""
+        cw = max(self.prevalence_canvas.winfo_width(), 200)
+        ch = 28
+        key = (cw, tuple(all_cols))
+        if key == self._prevalence_key:
+            return
+        self._prevalence_key = key
+
+        # Fill one pixel row segment by segment (remainder stays dark grey)
+        row = np.empty((cw, 3), np.uint8)
+        row[:] = (0x33, 0x33, 0x33)
+        x = 0
+        total_pct = sum(pct for _, pct in all_cols)
+        for hex_color, pct in all_cols:
+            w = max(1, int(pct / max(total_pct, 1) * cw))
+            row[x:x + w] = hex_to_rgb(hex_color)
+            x += w
+        img = Image.fromarray(np.repeat(row[None], ch, axis=0))
+
+        if self._prevalence_photo is None or self._prevalence_photo.width() != cw:
+            self._prevalence_photo = ImageTk.PhotoImage(img)
+            self.prevalence_canvas.delete("all")
+            self.prevalence_canvas.create_image(0, 0, anchor="nw", image=self._prevalence_photo)
+        else:
+            self._prevalence_photo.paste(img)
+
+    def _update_colormap_markers(self, snap: Optional[UiSnapshot] = None):
+        snap = snap or self.engine.snapshot()
+        dom_cols = snap.dominant_colors
+        smooth = snap.current_smooth_hex
 
         cw = max(self.colormap_canvas.winfo_width(), COLORMAP_W)
         ch = max(self.colormap_canvas.winfo_height(), COLORMAP_H)
 
+        # Markers only move when the colors (or the canvas size) change
+        key = (tuple(dom_cols), smooth, cw, ch)
+        if key == self._markers_key:
+            return
+        self._markers_key = key
+        self.colormap_canvas.delete("marker")
+
         # Draw accent color dots
         for hex_color, pct in dom_cols:
             h, s, v = hex_to_hsv(hex_color)
@@ -1042,90 +1572,102 @@ class ScreenColorAnalyzerApp:
             self.colormap_canvas.create_oval(x - 4, y - 4, x + 4, y + 4,
                                              outline="#ffffff", width=2, tags="marker")
 
-    def _update_history(self):
-        self.history_canvas.delete("all")
+    def _update_history(self, snap: UiSnapshot):
         cw = max(self.history_canvas.winfo_width(), 400)
         ch = HISTORY_H
         now = time.time()
         window = 5.0  # seconds
 
-        history = list(self.engine.color_history)
+        history = snap.color_history
         if not history:
+            self.history_canvas.delete("all")
+            self._history_photo = None
             self.history_canvas.create_text(
                 cw // 2, ch // 2, text="Waiting for data...",
                 fill="#555", font=("Segoe UI", 10))
             return
 
-        # Draw color strips
-        for i in range(len(history)):
-            ts, hex_color = history[i]
-            age = now - ts
-            if age > window:
-                continue
-            x = (1 - age / window) * cw
-            if i + 1 < len(history):
-                next_ts = history[i + 1][0]
-                next_age = now - next_ts
-                if next_age > window:
-                    x2 = 0
-                else:
-                    x2 = (1 - next_age / window) * cw
-            else:
-                x2 = cw
-            if x2 > x:
-                x, x2 = x2, x
-            self.history_canvas.create_rectangle(
-                int(x2), 0, int(x) + 1, ch, fill=hex_color, outline="")
-
-        # Draw send event markers
-        send_events = list(self.engine.send_events)
-        for ts in send_events:
-            age = now - ts
-            if age > window:
-                continue
-            x = (1 - age / window) * cw
-            self.history_canvas.create_line(
-                int(x), ch - 8, int(x), ch, fill="#ffffff", width=2)
-            self.history_canvas.create_polygon(
-                int(x) - 3, ch - 8, int(x) + 3, ch - 8, int(x), ch - 3,
-                fill="#ffffff", outline="")
-
-        # Time axis labels
-        for sec in range(0, 6):
-            x = (1 - sec / window) * cw
-            self.history_canvas.create_text(
-                int(x), ch - 2, text=f"-{sec}s", fill="#666",
-                font=("Consolas", 7), anchor="s")
-
-    def _update_simulation(self):
-        with self.engine.lock:
-            raw_hex = self.engine.current_raw_hex or "#000000"
-            smooth_hex = self.engine.current_smooth_hex or "#000000"
-            would_send = self.engine.would_send
+        # Render strips and markers into one pixel buffer, blitted as a single image
+        arr = np.empty((ch, cw, 3), np.uint8)
+        arr[:] = hex_to_rgb(CANVAS_BG)
+
+        # Strip i spans from its own x to the next entry's x (the right edge for
+        # the newest one); entries older than the window are skipped
+        ts = np.fromiter((t for t, _ in history), float, len(history))
+        xs = (1 - (now - ts) / window) * cw
+        next_xs = np.empty_like(xs)
+        next_xs[:-1] = np.maximum(xs[1:], 0)
+        next_xs[-1] = cw
+        lo = np.minimum(xs, next_xs).astype(int)
+        hi = np.maximum(xs, next_xs).astype(int) + 1
+        for i in np.flatnonzero(xs >= 0).tolist():
+            arr[:, lo[i]:hi[i]] = hex_to_rgb(history[i][1])
+
+        # Draw send event markers: a 2px tick with a small downward triangle
+        if snap.send_events:
+            ev_xs = (1 - (now - np.asarray(snap.send_events)) / window) * cw
+            for x in ev_xs[ev_xs >= 0].astype(int).tolist():
+                arr[ch - 8:ch, max(0, x - 1):x + 1] = 255
+                for dy, half in enumerate((3, 2, 2, 1, 1, 0)):
+                    arr[ch - 8 + dy, max(0, x - half):x + half + 1] = 255
 
-        # Main lamp circle
-        self.sim_canvas.delete("all")
-        cx = (SIM_SIZE + 20) // 2
-        cy = (SIM_SIZE + 10) // 2
-        r = SIM_SIZE // 2 - 4
+        img = Image.fromarray(arr)
+        if self._history_photo is None or self._history_photo.width() != cw:
+            self._history_photo = ImageTk.PhotoImage(img)
+            self.history_canvas.delete("all")
+            self.history_canvas.create_image(0, 0, anchor="nw", image=self._history_photo)
+
+            # Time axis labels (only move when the canvas is resized)
+            for sec in range(0, 6):
+                x = (1 - sec / window) * cw
+                self.history_canvas.create_text(
+                    int(x), ch - 2, text=f"-{sec}s", fill="#666",
+                    font=("Consolas", 7), anchor="s")
+        else:
+            self._history_photo.paste(img)
 
-        # Glow effect
-        for i in range(3):
-            gr = r + (3 - i) * 3
-            try:
-                rr, gg, bb = hex_to_rgb(smooth_hex)
-                glow_hex = rgb_to_hex(max(0, rr // 3), max(0, gg // 3), max(0, bb // 3))
-            except Exception:
-                glow_hex = "#111111"
-            self.sim_canvas.create_oval(cx - gr, cy - gr, cx + gr, cy + gr,
-                                        fill="", outline=glow_hex, width=2)
+    def _update_simulation(self, snap: UiSnapshot):
+        raw_hex = snap.current_raw_hex or "#000000"
+        smooth_hex = snap.current_smooth_hex or "#000000"
+        would_send = snap.would_send
 
-        self.sim_canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
-                                    fill=smooth_hex, outline="#444", width=2)
-        # Highlight
-        self.sim_canvas.create_oval(cx - r // 2, cy - r // 2 - r // 4,
-                                    cx, cy - r // 4,
-                                    fill="", outline="#666666", width=1)
+        # Send indicator
+        if would_send:
+            if self.lamp_send_enabled and self.lamp_connected:
+                send_state = ("\u2191 SENT to lamp", "#50fa7b")
+            else:
+                send_state = ("\u2191 Threshold exceeded", "#f1fa8c")
+        else:
+            send_state = ("-- below threshold --", "#666666")
+        if send_state != self._sim_send_state:
+            self._sim_send_state = send_state
+            self.send_var.set(send_state[0])
+            self.send_label.configure(foreground=send_state[1])
+
+        # The smoothing filter often repeats the same colors; skip the redraw then
+        if (smooth_hex, raw_hex) == self._sim_last:
+            return
+        self._sim_last = (smooth_hex, raw_hex)
+
+        # Glow effect (pre-rendered per color) and main lamp circle; the items
+        # are created once and only recolored afterwards
+        glow = self._get_sim_glow(smooth_hex)
+        if self._sim_items is None:
+            cx = (SIM_SIZE + 20) // 2
+            cy = (SIM_SIZE + 10) // 2
+            r = SIM_SIZE // 2 - 4
+            glow_item = self.sim_canvas.create_image(0, 0, anchor="nw", image=glow)
+            lamp_item = self.sim_canvas.create_oval(cx - r, cy - r, cx + r, cy + r,
+                                                    fill=smooth_hex, outline="#444", width=2)
+            # Highlight
+            self.sim_canvas.create_oval(cx - r // 2, cy - r // 2 - r // 4,
+                                        cx, cy - r // 4,
+                                        fill="", outline="#666666", width=1)
+            self._sim_items = (glow_item, lamp_item)
+        else:
+            glow_item, lamp_item = self._sim_items
+            self.sim_canvas.itemconfigure(glow_item, image=glow)
+            self.sim_canvas.itemconfigure(lamp_item, fill=smooth_hex)
 
         self.sim_hex_var.set(smooth_hex)
 
@@ -1133,17 +1675,33 @@ class ScreenColorAnalyzerApp:
         self.raw_swatch.configure(bg=raw_hex)
         self.smooth_swatch.configure(bg=smooth_hex)
 
-        # Send indicator
-        if would_send:
-            if self.lamp_send_enabled and self.lamp_connected:
-                self.send_var.set("\u2191 SENT to lamp")
-                self.send_label.configure(foreground="#50fa7b")
-            else:
-                self.send_var.set("\u2191 Threshold exceeded")
-                self.send_label.configure(foreground="#f1fa8c")
-        else:
-            self.send_var.set("-- below threshold --")
-            self.send_label.configure(foreground="#666666")
+    def _get_sim_glow(self, smooth_hex: str) -> "ImageTk.PhotoImage":
+        """Return the lamp glow rings for this color, rendering them on a cache miss."""
+        photo = self._sim_glow_cache.get(smooth_hex)
+        if photo is not None:
+            self._sim_glow_cache.move_to_end(smooth_hex)
+            return photo
+
+        try:
+            rr, gg, bb = hex_to_rgb(smooth_hex)
+            glow = (rr // 3, gg // 3, bb // 3)
+        except Exception:
+            glow = (0x11, 0x11, 0x11)
+
+        cx = (SIM_SIZE + 20) // 2
+        cy = (SIM_SIZE + 10) // 2
+        r = SIM_SIZE // 2 - 4
+        img = Image.new("RGB", (SIM_SIZE + 20, SIM_SIZE + 10), CANVAS_BG)
+        draw = ImageDraw.Draw(img)
+        for i in range(3):
+            gr = r + (3 - i) * 3
+            draw.ellipse([cx - gr, cy - gr, cx + gr, cy + gr], outline=glow, width=2)
+
+        photo = ImageTk.PhotoImage(img)
+        self._sim_glow_cache[smooth_hex] = photo
+        if len(self._sim_glow_cache) > 64:
+            self._sim_glow_cache.popitem(last=False)
+        return photo
 
     def _update_info_panel(self, hex_color: str, percentage: float = 0.0):
         """Update the color analysis panel for the selected color."""
@@ -1159,52 +1717,54 @@ class ScreenColorAnalyzerApp:
 
         bd = calculate_score_breakdown(hex_color, percentage)
 
-        self.score_text.configure(state="normal")
-        self.score_text.delete("1.0", "end")
+        # Collect (text, tag) runs and insert them with one Text.insert call
+        runs: List[str] = []
 
-        if bd.get("rejected") and bd["total"] == 0 and bd["sat_score"] == 0:
-            self.score_text.insert("end", "REJECTED\n", "bad")
-            self.score_text.insert("end", bd.get("sat_reason", "Low quality"), "label")
-            self.score_text.configure(state="disabled")
-            return
+        def add(text: str, tag: str):
+            runs.extend((text, tag))
 
-        # Total score
-        total = bd["total"]
-        tag = "good" if total >= 60 else ("ok" if total >= 30 else "bad")
-        self.score_text.insert("end", f"Ambient Score: {total:.1f}\n", "header")
-        self.score_text.insert("end", "\u2500" * 32 + "\n", "label")
-
-        # Components
-        components = [
-            ("Saturation", bd["sat_score"], 80, bd["sat_reason"]),
-            ("Brightness", bd["bri_score"], 30, bd["bri_reason"]),
-            ("Prevalence", bd["prev_score"], 25, bd["prev_reason"]),
-            ("Hue Pref", bd["hue_score"], 20, bd["hue_reason"]),
-        ]
-
-        for name, score, max_val, reason in components:
-            bar_len = 15
-            if max_val > 0:
-                filled = max(0, int(score / max_val * bar_len))
-            else:
-                filled = 0
-            bar = "\u2588" * filled + "\u2591" * (bar_len - filled)
-            sc_tag = "good" if score >= max_val * 0.6 else ("ok" if score > 0 else "bad")
-            self.score_text.insert("end", f"  {name:<12}", "label")
-            self.score_text.insert("end", f"{bar} ", sc_tag)
-            self.score_text.insert("end", f"{score:>5.1f}", sc_tag)
-            self.score_text.insert("end", f" / {max_val}\n", "label")
-            self.score_text.insert("end", f"{'':>14}{reason}\n", "value")
-
-        # Penalties
-        if bd["penalties"] != 0 or bd["penalty_reasons"]:
-            pen = bd["penalties"]
-            pen_tag = "bad" if pen < 0 else "good"
-            self.score_text.insert("end", f"\n  {'Penalties':<12}", "label")
-            self.score_text.insert("end", f"{pen:+.0f}\n", pen_tag)
-            for pr in bd["penalty_reasons"]:
-                self.score_text.insert("end", f"{'':>14}{pr}\n", "value")
+        if bd.get("rejected") and bd["total"] == 0 and bd["sat_score"] == 0:
+            add("REJECTED\n", "bad")
+            add(bd.get("sat_reason", "Low quality"), "label")
+        else:
+            # Total score
+            total = bd["total"]
+            add(f"Ambient Score: {total:.1f}\n", "header")
+            add("\u2500" * 32 + "\n", "label")
+
+            # Components
+            components = [
+                ("Saturation", bd["sat_score"], 80, bd["sat_reason"]),
+                ("Brightness", bd["bri_score"], 30, bd["bri_reason"]),
+                ("Prevalence", bd["prev_score"], 25, bd["prev_reason"]),
+                ("Hue Pref", bd["hue_score"], 20, bd["hue_reason"]),
+            ]
+
+            for name, score, max_val, reason in components:
+                bar_len = 15
+                if max_val > 0:
+                    filled = max(0, int(score / max_val * bar_len))
+                else:
+                    filled = 0
+                bar = "\u2588" * filled + "\u2591" * (bar_len - filled)
+                sc_tag = "good" if score >= max_val * 0.6 else ("ok" if score > 0 else "bad")
+                add(f"  {name:<12}", "label")
+                add(f"{bar} {score:>5.1f}", sc_tag)
+                add(f" / {max_val}\n", "label")
+                add(f"{'':>14}{reason}\n", "value")
+
+            # Penalties
+            if bd["penalties"] != 0 or bd["penalty_reasons"]:
+                pen = bd["penalties"]
+                pen_tag = "bad" if pen < 0 else "good"
+                add(f"\n  {'Penalties':<12}", "label")
+                add(f"{pen:+.0f}\n", pen_tag)
+                for pr in bd["penalty_reasons"]:
+                    add(f"{'':>14}{pr}\n", "value")
 
+        self.score_text.configure(state="normal")
+        self.score_text.delete("1.0", "end")
+        self.score_text.insert("end", *runs)
         self.score_text.configure(state="disabled")
 
     # ── Event Handlers ───────────────────────────────────────────────────
@@ -1240,6 +1800,8 @@ class ScreenColorAnalyzerApp:
         if self.engine.running:
             self.engine.stop()
             self.start_btn.configure(text="\u25b6 Start")
+            # Paused: redraw the still frame once at full quality
+            self._update_preview(resample=Image.LANCZOS)
         else:
             self.engine.start()
             self.start_btn.configure(text="\u23f8 Stop")
@@ -1278,7 +1840,8 @@ class ScreenColorAnalyzerApp:
             self._update_colormap_markers()
 
     def _on_preview_click(self, event):
-        if not hasattr(self, "_preview_scale") or self.engine.latest_frame is None:
+        frame = self._preview_frame
+        if frame is None:
             return
         ox, oy = self._preview_offset
         scale = self._preview_scale
@@ -1288,17 +1851,22 @@ class ScreenColorAnalyzerApp:
         img_y = int((event.y - oy) / scale)
 
         if 0 <= img_x < w and 0 <= img_y < h:
-            with self.engine.lock:
-                frame = self.engine.latest_frame
-            if frame is not None:
-                r, g, b = frame[img_y, img_x]
-                hex_color = rgb_to_hex(int(r), int(g), int(b))
-                self._update_info_panel(hex_color, 0.0)
+            b, g, r = frame[img_y, img_x, :3]
+            hex_color = rgb_to_hex(int(r), int(g), int(b))
+            self._update_info_panel(hex_color, 0.0)
 
     def _on_preview_motion(self, event):
-        if not hasattr(self, "_preview_scale") or self.engine.latest_frame is None:
+        frame = self._preview_frame
+        if frame is None:
             self._preview_hex_var.set("")
             return
+
+        # Hover readout is throttled to ~30 Hz
+        now = time.perf_counter()
+        if now - self._motion_last_ts < 0.033:
+            return
+        self._motion_last_ts = now
+
         ox, oy = self._preview_offset
         scale = self._preview_scale
         w, h = self._preview_img_size
@@ -1307,12 +1875,12 @@ class ScreenColorAnalyzerApp:
         img_y = int((event.y - oy) / scale)
 
         if 0 <= img_x < w and 0 <= img_y < h:
-            with self.engine.lock:
-                frame = self.engine.latest_frame
-            if frame is not None:
-                r, g, b = frame[img_y, img_x]
-                hex_color = rgb_to_hex(int(r), int(g), int(b))
-                self._preview_hex_var.set(f"{hex_color}  ({img_x}, {img_y})  RGB({r}, {g}, {b})")
+            b, g, r = frame[img_y, img_x, :3]
+            hex_color = rgb_to_hex(int(r), int(g), int(b))
+            # Report screen coordinates, not preview-buffer coordinates
+            fw, fh = self.engine.frame_size
+            sx, sy = img_x * fw // w, img_y * fh // h
+            self._preview_hex_var.set(f"{hex_color}  ({sx}, {sy})  RGB({r}, {g}, {b})")
         else:
             self._preview_hex_var.set("")
 
@@ -1398,6 +1966,7 @@ class ScreenColorAnalyzerApp:
 
     def _on_close(self):
         self.engine.stop()
+        self._preview_executor.shutdown(wait=False)
         if self.device_manager:
             try:
                 self.device_manager.close()
@@ -6,7 +6,7 @@ Provides transparency into why specific colors are chosen for ambient lighting
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Tuple, List, Optional
+from typing import Callable, Tuple, List, Optional
 try:
     from PIL import Image
     PIL_AVAILABLE = True
@@ -100,22 +100,31 @@ class ColorDecisionReport:
     timestamp: datetime
     winner: Optional[ColorCandidate]
     candidates: List[ColorCandidate]  # All considered colors with scores
-    screen_thumbnail: Optional[any] = None  # PIL Image if available
+    # Builds the PIL screen thumbnail on demand (only the UI ever looks at it)
+    thumbnail_source: Optional[Callable[[], any]] = field(default=None, repr=False)
     decision_summary: str = ""  # Human-readable explanation
+    _thumbnail: Optional[any] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def screen_thumbnail(self) -> Optional[any]:
+        """PIL Image of the analyzed screen if available, built on first access"""
+        if self._thumbnail is None and self.thumbnail_source is not None:
+            self._thumbnail = self.thumbnail_source()
+        return self._thumbnail
 
     @classmethod
     def create(
         cls,
         winner: Optional[ColorCandidate],
         candidates: List[ColorCandidate],
-        screen_thumbnail: Optional[any] = None
+        thumbnail_source: Optional[Callable[[], any]] = None
     ) -> "ColorDecisionReport":
         """Create a decision report with auto-generated summary"""
         report = cls(
             timestamp=datetime.now(),
             winner=winner,
             candidates=candidates,
-            screen_thumbnail=screen_thumbnail,
+            thumbnail_source=thumbnail_source,
             decision_summary=""
         )
         report.decision_summary = report._generate_summary()
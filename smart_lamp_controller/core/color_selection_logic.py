@@ -5,6 +5,8 @@ Separated logic that can be used by any UI component
 """
 
 import colorsys
+import functools
+import sys
 from typing import Tuple, Dict, List, Optional, Callable
 try:
     import mss
@@ -14,6 +16,16 @@ try:
 except ImportError:
     SCREEN_CAPTURE_AVAILABLE = False
 
+# Optional JIT for the dominant color histogram
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# numba's on-disk cache needs the .py source, which a frozen (PyInstaller) build lacks
+_NUMBA_CACHE = not getattr(sys, "frozen", False)
+
 # Import color decision types for score breakdowns
 try:
     from color_decision import ColorScoreBreakdown, ColorCandidate, ColorDecisionReport
@@ -21,6 +33,44 @@ try:
 except ImportError:
     COLOR_DECISION_AVAILABLE = False
 
+# Each channel is quantized to 8 levels (3 bits), so a color packs into 9 bits
+HISTOGRAM_BINS = 512
+
+if NUMBA_AVAILABLE:
+    try:
+        @njit(parallel=True, cache=_NUMBA_CACHE)
+        def _color_histogram_jit(pixels, n_tiles):
+            """Per-tile histograms of packed quantized colors, reduced at the end"""
+            n = pixels.shape[0]
+            tile_size = (n + n_tiles - 1) // n_tiles
+            tile_hists = np.zeros((n_tiles, HISTOGRAM_BINS), np.int64)
+            for t in prange(n_tiles):
+                end = min(n, (t + 1) * tile_size)
+                for i in range(t * tile_size, end):
+                    key = ((pixels[i, 0] >> 5) << 6) | ((pixels[i, 1] >> 5) << 3) | (pixels[i, 2] >> 5)
+                    tile_hists[t, key] += 1
+            return tile_hists.sum(axis=0)
+    except Exception:
+        # e.g. RuntimeError "no locator available" when the source file isn't shipped
+        NUMBA_AVAILABLE = False
+
+
+def quantized_color_histogram(pixels) -> "np.ndarray":
+    """Count (N, 3) uint8 pixels per quantized color bin (r3 g3 b3 packed key)"""
+    if NUMBA_AVAILABLE:
+        return _color_histogram_jit(pixels, 8)
+    q = pixels >> 5
+    keys = (q[:, 0].astype(np.intp) << 6) | (q[:, 1].astype(np.intp) << 3) | q[:, 2]
+    return np.bincount(keys, minlength=HISTOGRAM_BINS)
+
+
+def _render_thumbnail(bgra: bytes, size: Tuple[int, int], thumbnail_size: Tuple[int, int]) -> "Image.Image":
+    """Antialiased PIL thumbnail of a raw mss BGRA capture, for display"""
+    img = Image.frombuffer("RGB", size, bgra, "raw", "BGRX", 0, 1)
+    img.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
+    return img
+
+
 class ColorSelectionLogic:
     """Core logic for color selection, analysis, and justification"""
     
@@ -28,11 +78,38 @@ class ColorSelectionLogic:
         self.selected_color = "#ff0000"
         self.selected_position = (0.5, 0.5)  # Normalized coordinates (0-1)
         self.monitor_index = 1  # Default to first monitor
-        self.screen_thumbnail = None
         self.thumbnail_size = (160, 120)
-    
+        self.screen_thumbnail = None
+
+    @property
+    def screen_thumbnail(self) -> Optional[any]:
+        """PIL view of the current thumbnail, built lazily (and antialiased) from the capture"""
+        if self._thumbnail_image is None:
+            if self._thumbnail_source is not None:
+                self._thumbnail_image = self._thumbnail_source()
+            elif self._thumbnail_array is not None:
+                self._thumbnail_image = Image.fromarray(self._thumbnail_array)
+        return self._thumbnail_image
+
+    @screen_thumbnail.setter
+    def screen_thumbnail(self, img: Optional[any]):
+        self._thumbnail_image = img
+        self._thumbnail_source = None
+        self._thumbnail_array = None if img is None else np.asarray(img.convert("RGB"))
+
+    def _thumbnail_factory(self) -> Optional[Callable[[], any]]:
+        """Callable returning this frame's PIL thumbnail, for reports that may never show it"""
+        if self._thumbnail_image is not None:
+            img = self._thumbnail_image
+            return lambda: img
+        if self._thumbnail_source is not None:
+            return self._thumbnail_source
+        if self._thumbnail_array is not None:
+            return functools.partial(Image.fromarray, self._thumbnail_array)
+        return None
+
     def capture_screen_thumbnail(self, monitor_index: int = None) -> Optional[any]:
-        """Capture a thumbnail of the specified monitor"""
+        """Capture a thumbnail of the specified monitor as an (h, w, 3) RGB array"""
         if not SCREEN_CAPTURE_AVAILABLE:
             return None
             
@@ -48,17 +125,25 @@ class ColorSelectionLogic:
                 
                 # Capture screen
                 screenshot = sct.grab(monitor)
-                
-                # Convert to PIL Image
-                img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-                
-                # Resize to thumbnail
-                img.thumbnail(self.thumbnail_size, Image.Resampling.LANCZOS)
-                
-                # Store for later use
-                self.screen_thumbnail = img
-                
-                return img
+                width, height = screenshot.size
+
+                # Wrap mss's BGRA buffer without copying
+                raw = screenshot.bgra
+                bgra = np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 4)
+
+                # Strided decimation to fit the thumbnail size (no antialiasing
+                # needed for ambient color), swapping BGR -> RGB in the same view
+                step = max(1, -(-width // self.thumbnail_size[0]), -(-height // self.thumbnail_size[1]))
+                thumbnail = np.ascontiguousarray(bgra[::step, ::step, 2::-1])
+
+                # Store for later use; the display image is only resampled from
+                # the full capture if a UI actually asks for it
+                self._thumbnail_array = thumbnail
+                self._thumbnail_image = None
+                self._thumbnail_source = functools.partial(
+                    _render_thumbnail, raw, screenshot.size, self.thumbnail_size)
+
+                return thumbnail
                 
         except Exception as e:
             print(f"Screen capture error: {e}")
@@ -120,19 +205,16 @@ class ColorSelectionLogic:
     
     def analyze_color_prevalence(self, target_color: str, tolerance: float = 0.15) -> Optional[any]:
         """Analyze how prevalent a color is in the current screen thumbnail"""
-        if not SCREEN_CAPTURE_AVAILABLE or self.screen_thumbnail is None:
+        if not SCREEN_CAPTURE_AVAILABLE or self._thumbnail_array is None:
             return None
             
         try:
-            import numpy as np
-            
             # Convert target color to RGB
             target_r = int(target_color[1:3], 16)
             target_g = int(target_color[3:5], 16) 
             target_b = int(target_color[5:7], 16)
             
-            # Convert PIL image to numpy array
-            img_array = np.array(self.screen_thumbnail)
+            img_array = self._thumbnail_array
             
             # Calculate color distance for each pixel
             r_diff = (img_array[:, :, 0] - target_r) / 255.0
@@ -181,39 +263,29 @@ class ColorSelectionLogic:
     
     def get_dominant_colors(self, num_colors: int = 5) -> List[Tuple[str, float]]:
         """Get the most dominant colors from the screen thumbnail - filtered to exclude grays/blacks"""
-        if not SCREEN_CAPTURE_AVAILABLE or self.screen_thumbnail is None:
+        if not SCREEN_CAPTURE_AVAILABLE or self._thumbnail_array is None:
             return []
             
         try:
-            import numpy as np
-            from collections import Counter
-            
-            # Convert to numpy array and reshape to list of pixels
-            img_array = np.array(self.screen_thumbnail)
-            pixels = img_array.reshape(-1, 3)
+            # Reshape to list of pixels
+            pixels = self._thumbnail_array.reshape(-1, 3)
             
-            # Quantize colors to reduce noise (group similar colors)
-            quantized = (pixels // 32) * 32  # Reduce to 8 levels per channel
+            # Count frequencies of quantized colors (8 levels per channel)
+            counts = quantized_color_histogram(pixels)
             
-            # Count color frequencies
-            unique_colors, counts = np.unique(quantized, axis=0, return_counts=True)
-            
-            # Sort by frequency
-            sorted_indices = np.argsort(counts)[::-1]
+            # Sort occupied bins by frequency
+            sorted_keys = np.argsort(-counts, kind='stable')[:np.count_nonzero(counts)]
             
             # Get colors and filter out grays/blacks/whites
             filtered_colors = []
             total_pixels = len(pixels)
             
-            for i in range(len(unique_colors)):
-                idx = sorted_indices[i]
-                color_rgb = unique_colors[idx]
-                frequency = counts[idx]
-                percentage = (frequency / total_pixels) * 100
+            for key in sorted_keys.tolist():
+                percentage = (counts[key] / total_pixels) * 100
                 
-                # Convert to hex
+                # Unpack the bin key to hex
                 hex_color = '#{:02x}{:02x}{:02x}'.format(
-                    int(color_rgb[0]), int(color_rgb[1]), int(color_rgb[2])
+                    (key >> 6) << 5, ((key >> 3) & 7) << 5, (key & 7) << 5
                 )
                 
                 # Filter out grays, blacks, and whites
@@ -528,8 +600,12 @@ class ColorSelectionLogic:
         except Exception:
             return 0
 
-    def calculate_ambient_score_with_breakdown(self, hex_color: str, percentage: float) -> "ColorScoreBreakdown":
-        """Calculate score with detailed breakdown for transparency"""
+    def calculate_ambient_score_with_breakdown(self, hex_color: str, percentage: float,
+                                               hsv: Optional[Tuple[float, float, float]] = None) -> "ColorScoreBreakdown":
+        """Calculate score with detailed breakdown for transparency
+
+        hsv may be passed in when it was already computed for a batch of colors.
+        """
         if not COLOR_DECISION_AVAILABLE:
             # Fallback if data classes not available
             return None
@@ -543,7 +619,7 @@ class ColorSelectionLogic:
             b = int(hex_color[5:7], 16) / 255
 
             # Convert to HSV
-            h, s, v = colorsys.rgb_to_hsv(r, g, b)
+            h, s, v = hsv if hsv is not None else colorsys.rgb_to_hsv(r, g, b)
             hue_deg = h * 360
 
             # 1. Saturation scoring (minimum 50%)
@@ -641,18 +717,20 @@ class ColorSelectionLogic:
         best_score = -1
         best_candidate = None
 
-        for color, percentage in dominant_colors:
+        # Convert all candidates to HSV in one pass
+        hsv_values = self.hex_colors_to_hsv([color for color, _ in dominant_colors])
+
+        for (color, percentage), (h, s, v) in zip(dominant_colors, hsv_values):
             # Get breakdown
-            breakdown = self.calculate_ambient_score_with_breakdown(color, percentage)
+            breakdown = self.calculate_ambient_score_with_breakdown(color, percentage, (h, s, v))
 
             if breakdown is None:
                 continue
 
-            # Convert to RGB and HSV for candidate
+            # Convert to RGB for candidate
             r = int(color[1:3], 16)
             g = int(color[3:5], 16)
             b = int(color[5:7], 16)
-            h, s, v = colorsys.rgb_to_hsv(r/255, g/255, b/255)
 
             # Determine if rejected
             rejection_reason = None
@@ -689,11 +767,44 @@ class ColorSelectionLogic:
         report = ColorDecisionReport.create(
             winner=best_candidate,
             candidates=candidates,
-            screen_thumbnail=self.screen_thumbnail
+            thumbnail_source=self._thumbnail_factory()
         )
 
         return best_color if best_score > 0 else None, report
 
+    def hex_colors_to_hsv(self, hex_colors: List[str]) -> List[Tuple[float, float, float]]:
+        """Convert hex colors to HSV (0-1 ranges), vectorized when NumPy is available"""
+        if not SCREEN_CAPTURE_AVAILABLE:
+            return [colorsys.rgb_to_hsv(*(int(c[i:i+2], 16) / 255 for i in (1, 3, 5))) for c in hex_colors]
+        if not hex_colors:
+            return []
+
+        packed = np.array([int(c[1:7], 16) for c in hex_colors], dtype=np.int64)
+        rgb = np.stack(((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF), axis=1) / 255.0
+        r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+
+        cmax = rgb.max(axis=1)
+        cmin = rgb.min(axis=1)
+        delta = cmax - cmin
+
+        v = cmax
+        s = np.where(cmax > 0, delta / np.where(cmax > 0, cmax, 1), 0.0)
+
+        # Same sector rules and operation order as colorsys.rgb_to_hsv, so
+        # hues land bit-for-bit on the same side of the scoring thresholds
+        safe_delta = np.where(delta > 0, delta, 1)
+        rc = (cmax - r) / safe_delta
+        gc = (cmax - g) / safe_delta
+        bc = (cmax - b) / safe_delta
+        h = np.select(
+            [delta == 0, cmax == r, cmax == g],
+            [0.0, bc - gc, 2.0 + rc - bc],
+            4.0 + gc - rc,
+        )
+        h = (h / 6.0) % 1.0
+
+        return list(zip(h.tolist(), s.tolist(), v.tolist()))
+
     def is_skin_tone(self, r: float, g: float, b: float) -> bool:
         """Check if color is likely a skin tone"""
         # Simple skin tone detection
@@ -5,18 +5,19 @@ Uses the intelligent color selection logic to continuously update lamp color
 """
 
 import threading
-import time
 import logging
-from typing import Optional, Callable
+from collections import deque
+from typing import Optional, Callable, TYPE_CHECKING
 from color_selection_logic import ColorSelectionLogic, SCREEN_CAPTURE_AVAILABLE
 
-# Try to import decision report types
-try:
+# Decision report types are only referenced in annotations
+if TYPE_CHECKING:
     from color_decision import ColorDecisionReport
-    COLOR_DECISION_AVAILABLE = True
-except ImportError:
-    COLOR_DECISION_AVAILABLE = False
-    ColorDecisionReport = None
+
+# Status messages (formatted only when the status actually changes)
+STATUS_APPLIED = "Auto-applied: {} ({:.1f}% of screen)"
+STATUS_NO_SUITABLE = "No suitable colors found - screen mostly grayscale"
+STATUS_NO_COLORS = "No colors detected on screen"
 
 class SmartAmbientProcessor:
     """Automatically picks and applies the best screen color for ambient lighting"""
@@ -32,12 +33,23 @@ class SmartAmbientProcessor:
         # Parameters
         self.update_interval = 1.0  # Update every second
         self.monitor_index = 1  # Default to primary monitor
-        self.min_color_change_threshold = 0.1  # Only update if color changed significantly
+        self.min_color_change_threshold = 0.1  # Only update if color changed significantly (0-1 RGB distance)
+        self.adaptive_interval = True  # Tune update_interval to how often the screen changes
+        self.min_update_interval = 0.5
+        self.max_update_interval = 5.0
         
         # State
         self.current_color = "#000000"
         self.last_sent_color = "#000000"
         self.thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+
+        # Scene-change tracking for the adaptive interval
+        self._last_frame_hash: Optional[int] = None
+        self._frame_changes = deque(maxlen=10)
+
+        # Last status reported from the processing loop, to skip repeats
+        self._last_status_key: Optional[tuple] = None
         
         # Callbacks
         self.color_callback: Optional[Callable[[str], None]] = None
@@ -62,7 +74,9 @@ class SmartAmbientProcessor:
         self.color_callback = color_callback
         self.status_callback = status_callback
         self.decision_callback = decision_callback
+        self._last_status_key = None
         self.running = True
+        self.stop_event.clear()
         self.active = True
         
         # Start processing thread
@@ -82,6 +96,7 @@ class SmartAmbientProcessor:
         
         self.running = False
         self.active = False
+        self.stop_event.set()
         
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2.0)
@@ -90,6 +105,17 @@ class SmartAmbientProcessor:
         if self.status_callback:
             self.status_callback("Smart ambient lighting stopped")
     
+    @property
+    def min_color_change_threshold(self) -> float:
+        """Minimum RGB distance (0-1 scale) before a new color is sent"""
+        return self._min_color_change_threshold
+
+    @min_color_change_threshold.setter
+    def min_color_change_threshold(self, threshold: float):
+        self._min_color_change_threshold = threshold
+        # Squared and scaled to 0-255 channels so the hot path stays integer-only
+        self._threshold_sq_u8 = (threshold * 255) ** 2
+
     def set_monitor(self, monitor_index: int):
         """Set which monitor to analyze"""
         self.monitor_index = monitor_index
@@ -98,9 +124,48 @@ class SmartAmbientProcessor:
     
     def set_update_interval(self, interval: float):
         """Set how often to update the color (in seconds)"""
-        self.update_interval = max(0.5, min(5.0, interval))  # Clamp between 0.5-5 seconds
+        self.update_interval = max(self.min_update_interval, min(self.max_update_interval, interval))  # Clamp between 0.5-5 seconds
+        self._frame_changes.clear()
+
+        # Wake the processing loop so the new interval applies immediately
+        if self.running:
+            self.stop_event.set()
+            self.stop_event.clear()
         self.logger.info(f"Smart ambient update interval set to {self.update_interval}s")
+
+    def _adapt_update_interval(self, thumbnail) -> None:
+        """Speed up on busy scenes and back off on static ones"""
+        if not self.adaptive_interval or thumbnail is None:
+            return
+
+        frame_hash = hash(thumbnail.tobytes())
+        self._frame_changes.append(frame_hash != self._last_frame_hash)
+        self._last_frame_hash = frame_hash
+
+        if len(self._frame_changes) < self._frame_changes.maxlen:
+            return
+
+        change_rate = sum(self._frame_changes) / len(self._frame_changes)
+        if change_rate > 0.7:
+            new_interval = max(self.min_update_interval, self.update_interval - 0.5)
+        elif change_rate < 0.1:
+            new_interval = min(self.max_update_interval, self.update_interval * 2)
+        else:
+            return
+
+        if new_interval != self.update_interval:
+            self.update_interval = new_interval
+            self._frame_changes.clear()
+            self.logger.debug(f"Smart ambient update interval adapted to {self.update_interval}s "
+                              f"({change_rate:.0%} of frames changed)")
     
+    def _report_status(self, key: tuple, template: str, *args) -> None:
+        """Send a status update only when it differs from the last one"""
+        if key == self._last_status_key or not self.status_callback:
+            return
+        self._last_status_key = key
+        self.status_callback(template.format(*args) if args else template)
+
     def _processing_loop(self):
         """Main processing loop - runs in background thread"""
         consecutive_failures = 0
@@ -109,7 +174,8 @@ class SmartAmbientProcessor:
         while self.running:
             try:
                 # Capture screen thumbnail
-                self.color_logic.capture_screen_thumbnail()
+                thumbnail = self.color_logic.capture_screen_thumbnail()
+                self._adapt_update_interval(thumbnail)
                 
                 # Get dominant colors (filtered - no grays/blacks)
                 dominant_colors = self.color_logic.get_dominant_colors(8)
@@ -139,26 +205,25 @@ class SmartAmbientProcessor:
                             if self.color_callback:
                                 self.color_callback(best_color)
 
-                            # Find percentage for status
-                            color_percentage = next((p for c, p in dominant_colors if c == best_color), 0)
+                            # Find percentage for status (the report's winner already carries it)
+                            if decision_report and decision_report.winner:
+                                color_percentage = decision_report.winner.screen_percentage
+                            else:
+                                color_percentage = dict(dominant_colors).get(best_color, 0)
 
-                            if self.status_callback:
-                                self.status_callback(f"Auto-applied: {best_color} ({color_percentage:.1f}% of screen)")
+                            self._report_status(("applied", best_color), STATUS_APPLIED,
+                                                best_color, color_percentage)
 
                             self.logger.debug(f"Smart ambient applied color: {best_color}")
 
                         consecutive_failures = 0
                     else:
                         # No suitable colors found
-                        if consecutive_failures == 0:  # Only log first failure
-                            if self.status_callback:
-                                self.status_callback("No suitable colors found - screen mostly grayscale")
+                        self._report_status(("no_suitable",), STATUS_NO_SUITABLE)
                         consecutive_failures += 1
                 else:
                     # No colors found at all
-                    if consecutive_failures == 0:
-                        if self.status_callback:
-                            self.status_callback("No colors detected on screen")
+                    self._report_status(("no_colors",), STATUS_NO_COLORS)
                     consecutive_failures += 1
                 
                 # Reset failure count if we had too many
@@ -170,12 +235,11 @@ class SmartAmbientProcessor:
                 consecutive_failures += 1
                 
                 if consecutive_failures >= max_failures:
-                    if self.status_callback:
-                        self.status_callback(f"❌ Smart ambient error: {str(e)}")
+                    self._report_status(("error", str(e)), "❌ Smart ambient error: {}", e)
                     consecutive_failures = 0
             
-            # Wait for next update
-            time.sleep(self.update_interval)
+            # Wait for next update (returns early on stop or interval change)
+            self.stop_event.wait(self.update_interval)
     
     def _color_changed_significantly(self, new_color: str) -> bool:
         """Check if the new color is significantly different from the last sent color"""
@@ -183,19 +247,16 @@ class SmartAmbientProcessor:
             return True
         
         try:
-            # Convert both colors to RGB
-            old_r = int(self.last_sent_color[1:3], 16) / 255
-            old_g = int(self.last_sent_color[3:5], 16) / 255
-            old_b = int(self.last_sent_color[5:7], 16) / 255
-            
-            new_r = int(new_color[1:3], 16) / 255
-            new_g = int(new_color[3:5], 16) / 255
-            new_b = int(new_color[5:7], 16) / 255
-            
-            # Calculate Euclidean distance in RGB space
-            distance = ((new_r - old_r)**2 + (new_g - old_g)**2 + (new_b - old_b)**2)**0.5
-            
-            return distance > self.min_color_change_threshold
+            # Integer RGB channels of both colors
+            old_rgb = int(self.last_sent_color[1:7], 16)
+            new_rgb = int(new_color[1:7], 16)
+
+            dr = ((new_rgb >> 16) & 0xFF) - ((old_rgb >> 16) & 0xFF)
+            dg = ((new_rgb >> 8) & 0xFF) - ((old_rgb >> 8) & 0xFF)
+            db = (new_rgb & 0xFF) - (old_rgb & 0xFF)
+
+            # Squared Euclidean distance in 0-255 RGB space vs pre-scaled threshold
+            return dr * dr + dg * dg + db * db > self._threshold_sq_u8
             
         except Exception:
             return True  # If calculation fails, assume it changed
@@ -6,25 +6,119 @@ Complete Key Analysis - Show everything knowable about the key and device
 
 import sys
 import os
+import io
+import re
 import json
+import argparse
+import contextlib
 import tinytuya
 import time
 import hashlib
+import mmap
+
+# Optional faster JSON parser
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Fix Windows console encoding
-if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
+# AVANT_KEY = "..." assignments in Python config files
+_AVANT_KEY_RE = re.compile(rb'AVANT_KEY\s*=\s*["\']([^"\']+)["\']')
 
-def load_key_from_files():
-    """Try to load key from various files"""
-    print("=" * 70)
-    print("📁 Loading Key from Files")
-    print("=" * 70)
+# Decorative banners are skipped with --quiet (set in main)
+QUIET = False
+
+# Characters allowed in a hex-encoded key
+_HEX_CHARS = frozenset('0123456789abcdefABCDEF')
+
+# Per-attempt socket timeout (seconds) when probing protocol versions
+VERSION_PROBE_TIMEOUT = 2
+
+
+def _emit(lines):
+    """Write a section's buffered lines to stdout in one call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _banner(title, lead="\n"):
+    """Section header lines (none in --quiet mode)"""
+    if QUIET:
+        return []
+    return [lead + "=" * 70, title, "=" * 70]
+
+
+@contextlib.contextmanager
+def _mapped(f):
+    """Read-only view of an open file's bytes, mapped instead of read into memory"""
+    if os.fstat(f.fileno()).st_size == 0:
+        # Empty files can't be mapped
+        yield b""
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
+
+
+def _handle_json(buf, out):
+    """Return keys for our device from a JSON device list or config"""
+    # orjson parses the mapped bytes in place; json needs its own bytes copy
+    if ORJSON_AVAILABLE:
+        with memoryview(buf) as view:
+            data = orjson.loads(view)
+    else:
+        data = json.loads(buf[:])
+    out.append(f"   Content: {json.dumps(data, indent=2)}")
     
-    key_sources = {}
+    keys = []
+    # Look for key in various formats
+    if isinstance(data, dict):
+        # Check for device with our ID
+        if "devices" in data:
+            for device in data.get("devices", []):
+                if device.get("id") == "YOUR_DEVICE_ID":
+                    keys.append(device.get("key") or device.get("local_key") or device.get("localKey"))
+        # Check top level
+        keys.append(data.get("key") or data.get("local_key") or data.get("localKey"))
+    elif isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict) and item.get("id") == "YOUR_DEVICE_ID":
+                keys.append(item.get("key") or item.get("local_key"))
+    return [key for key in keys if key]
+
+
+def _handle_txt(buf, out):
+    """Return the key stored as plain text"""
+    key = buf[:].decode("utf-8").strip()
+    return [key] if key and len(key) >= 8 else []
+
+
+def _handle_py(buf, out):
+    """Return the AVANT_KEY value from a Python config file"""
+    # The pattern scans the mapped bytes; only the match is decoded
+    match = _AVANT_KEY_RE.search(buf)
+    key = match.group(1).decode("utf-8") if match else None
+    if key and key != "YOUR_LOCAL_KEY_HERE":
+        return [key]
+    return []
+
+
+# Key extraction by file extension
+_KEY_FILE_HANDLERS = {
+    ".json": _handle_json,
+    ".txt": _handle_txt,
+    ".py": _handle_py,
+}
+
+
+def load_key_from_files():
+    """Try to load key from various files; returns (filename, key) for the first hit, or None"""
+    out = _banner("📁 Loading Key from Files", lead="")
     
     # Check tinytuya.json
     files_to_check = [
@@ -36,114 +130,167 @@ def load_key_from_files():
     ]
     
     for filename in files_to_check:
-        if os.path.exists(filename):
-            print(f"\n✅ Found: {filename}")
-            try:
-                with open(filename, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    
-                if filename.endswith(".json"):
-                    data = json.loads(content)
-                    print(f"   Content: {json.dumps(data, indent=2)}")
-                    
-                    # Look for key in various formats
-                    if isinstance(data, dict):
-                        # Check for device with our ID
-                        if "devices" in data:
-                            for device in data.get("devices", []):
-                                if device.get("id") == "YOUR_DEVICE_ID":
-                                    key = device.get("key") or device.get("local_key") or device.get("localKey")
-                                    if key:
-                                        key_sources[filename] = key
-                                        print(f"   🎉 Found key: {key}")
-                        # Check top level
-                        key = data.get("key") or data.get("local_key") or data.get("localKey")
-                        if key:
-                            key_sources[filename] = key
-                            print(f"   🎉 Found key: {key}")
-                    elif isinstance(data, list):
-                        for item in data:
-                            if isinstance(item, dict) and item.get("id") == "YOUR_DEVICE_ID":
-                                key = item.get("key") or item.get("local_key")
-                                if key:
-                                    key_sources[filename] = key
-                                    print(f"   🎉 Found key: {key}")
-                elif filename.endswith(".txt"):
-                    key = content.strip()
-                    if key and len(key) >= 8:
-                        key_sources[filename] = key
-                        print(f"   🎉 Found key: {key}")
-                elif filename.endswith(".py"):
-                    # Extract key from Python file
-                    import re
-                    matches = re.findall(r'AVANT_KEY\s*=\s*["\']([^"\']+)["\']', content)
-                    if matches:
-                        key = matches[0]
-                        if key != "YOUR_LOCAL_KEY_HERE":
-                            key_sources[filename] = key
-                            print(f"   🎉 Found key: {key}")
-            except Exception as e:
-                print(f"   ⚠️  Error reading: {e}")
-        else:
-            print(f"\n❌ Not found: {filename}")
+        # Open directly rather than stat-ing first; a missing file is a single failed open
+        try:
+            f = open(filename, "rb")
+        except FileNotFoundError:
+            out.append(f"\n❌ Not found: {filename}")
+            continue
+        
+        out.append(f"\n✅ Found: {filename}")
+        try:
+            handler = _KEY_FILE_HANDLERS.get(os.path.splitext(filename)[1].lower())
+            with f, _mapped(f) as buf:
+                keys = handler(buf, out) if handler else []
+        except Exception as e:
+            out.append(f"   ⚠️  Error reading: {e}")
+            continue
+        
+        for key in keys:
+            out.append(f"   🎉 Found key: {key}")
+        
+        # Stop at the first file that yields a key (the last one found in it wins)
+        if keys:
+            _emit(out)
+            return filename, keys[-1]
     
-    return key_sources
+    _emit(out)
+    return None
 
 
 def analyze_key(key):
     """Analyze the key itself"""
-    print("\n" + "=" * 70)
-    print("🔍 Key Analysis")
-    print("=" * 70)
-    
-    print(f"\nKey Value: {key}")
-    print(f"Length: {len(key)} characters")
-    print(f"Type: {type(key).__name__}")
-    
-    # Character analysis
-    print(f"\nCharacter Analysis:")
-    print(f"  - Contains letters: {any(c.isalpha() for c in key)}")
-    print(f"  - Contains digits: {any(c.isdigit() for c in key)}")
-    print(f"  - Contains hex chars only: {all(c in '0123456789abcdefABCDEF' for c in key)}")
-    print(f"  - All lowercase: {key.islower()}")
-    print(f"  - All uppercase: {key.isupper()}")
-    print(f"  - Mixed case: {not (key.islower() or key.isupper())}")
+    out = _banner("🔍 Key Analysis")
+    
+    out.append(f"\nKey Value: {key}")
+    out.append(f"Length: {len(key)} characters")
+    out.append(f"Type: {type(key).__name__}")
+    
+    # Character analysis (one pass over the key)
+    has_alpha = has_digit = has_lower = has_upper = False
+    all_hex = True
+    for c in key:
+        if c.isalpha():
+            has_alpha = True
+            if c.islower():
+                has_lower = True
+            elif c.isupper():
+                has_upper = True
+        elif c.isdigit():
+            has_digit = True
+        if c not in _HEX_CHARS:
+            all_hex = False
+    all_lower = has_lower and not has_upper
+    all_upper = has_upper and not has_lower
+    
+    out.append(f"\nCharacter Analysis:")
+    out.append(f"  - Contains letters: {has_alpha}")
+    out.append(f"  - Contains digits: {has_digit}")
+    out.append(f"  - Contains hex chars only: {all_hex}")
+    out.append(f"  - All lowercase: {all_lower}")
+    out.append(f"  - All uppercase: {all_upper}")
+    out.append(f"  - Mixed case: {not (all_lower or all_upper)}")
     
     # Common key patterns
-    print(f"\nPattern Analysis:")
+    out.append(f"\nPattern Analysis:")
     if len(key) == 16:
-        print(f"  ✅ Standard length (16 characters - typical for Tuya)")
+        out.append(f"  ✅ Standard length (16 characters - typical for Tuya)")
     elif len(key) == 32:
-        print(f"  ⚠️  Long key (32 characters - might be double-encoded)")
+        out.append(f"  ⚠️  Long key (32 characters - might be double-encoded)")
     else:
-        print(f"  ⚠️  Non-standard length ({len(key)} characters)")
+        out.append(f"  ⚠️  Non-standard length ({len(key)} characters)")
     
     # Try to detect if it's hex
     try:
         bytes.fromhex(key)
-        print(f"  ✅ Valid hexadecimal")
+        out.append(f"  ✅ Valid hexadecimal")
     except:
-        print(f"  ⚠️  Not valid hexadecimal")
+        out.append(f"  ⚠️  Not valid hexadecimal")
     
     # Hash analysis
-    print(f"\nHash Analysis:")
-    md5 = hashlib.md5(key.encode()).hexdigest()
+    out.append(f"\nHash Analysis:")
     sha256 = hashlib.sha256(key.encode()).hexdigest()
-    print(f"  MD5: {md5}")
-    print(f"  SHA256: {sha256[:32]}...")
+    out.append(f"  SHA256: {sha256[:32]}...")
     
+    _emit(out)
     return key
 
 
-def test_key_with_device(key):
-    """Test the key with the actual device"""
-    print("\n" + "=" * 70)
-    print("🧪 Testing Key with Device")
-    print("=" * 70)
+# Devices opened by the current key test, closed again by _close_devices()
+_devices = {}
+
+
+def _device_for(device_id, device_ip, version, key):
+    """Configured device for one protocol version, kept with its socket open for reuse"""
+    cache_key = (device_id, device_ip, version, key)
+    d = _devices.get(cache_key)
+    if d is None:
+        d = tinytuya.Device(device_id, device_ip)
+        d.set_version(version)
+        d.set_key(key)
+        d.set_socketPersistent(True)
+        d.set_socketTimeout(VERSION_PROBE_TIMEOUT)
+        _devices[cache_key] = d
+    return d
+
+
+def _drop_device(device_id, device_ip, version, key):
+    """Close and forget one cached device (e.g. after its socket errored)"""
+    d = _devices.pop((device_id, device_ip, version, key), None)
+    if d is not None:
+        try:
+            d.close()
+        except Exception:
+            pass
+
+
+def _close_devices():
+    """Close every device socket opened by the key test"""
+    for cache_key in list(_devices):
+        _drop_device(*cache_key)
+
+
+def _probe_version(device_id, device_ip, key, version):
+    """Try status and control with one protocol version; returns (works, output lines)"""
+    lines = [f"\nTesting with version {version}..."]
+    try:
+        d = _device_for(device_id, device_ip, version, key)
+        
+        # Try to get status
+        status = d.status()
+        
+        if status.get("Error"):
+            error = status.get("Error", "")
+            if "key" in error.lower() or "914" in error:
+                lines.append(f"  ❌ Key authentication failed: {error}")
+            else:
+                lines.append(f"  ⚠️  Different error (might be progress): {error}")
+        else:
+            lines.append(f"  ✅ KEY WORKS! Status: {status}")
+            
+            # Try control
+            lines.append(f"  Testing control...")
+            result = d.turn_off()
+            if result.get("Error"):
+                lines.append(f"  ⚠️  Status OK but control failed: {result.get('Error')}")
+            else:
+                lines.append(f"  ✅ CONTROL WORKS! Key is fully functional!")
+                return True, lines
+    except Exception as e:
+        lines.append(f"  ❌ Exception: {str(e)[:50]}")
+        # Don't let a retry reuse a broken socket
+        _drop_device(device_id, device_ip, version, key)
+    
+    return False, lines
+
+
+def test_key_with_device(key, version_hint=None):
+    """Test the key with the actual device (trying version_hint first, if known)"""
+    _emit(_banner("🧪 Testing Key with Device"))
     
     device_ip = "YOUR_DEVICE_IP"
     device_id = "YOUR_DEVICE_ID"
-    version = "3.5"
+    version = version_hint or "3.5"
     
     print(f"\nDevice: {device_id} @ {device_ip}")
     print(f"Version: {version}")
@@ -152,50 +299,49 @@ def test_key_with_device(key):
     # Test with different versions
     versions = ["3.1", "3.3", "3.4", "3.5"]
     
-    for v in versions:
-        print(f"\nTesting with version {v}...")
-        try:
-            d = tinytuya.Device(device_id, device_ip)
-            d.set_version(v)
-            d.set_key(key)
-            
-            # Try to get status
-            status = d.status()
-            
-            if status.get("Error"):
-                error = status.get("Error", "")
-                if "key" in error.lower() or "914" in error:
-                    print(f"  ❌ Key authentication failed: {error}")
-                else:
-                    print(f"  ⚠️  Different error (might be progress): {error}")
-            else:
-                print(f"  ✅ KEY WORKS! Status: {status}")
-                
-                # Try control
-                print(f"  Testing control...")
-                result = d.turn_off()
-                if result.get("Error"):
-                    print(f"  ⚠️  Status OK but control failed: {result.get('Error')}")
-                else:
-                    print(f"  ✅ CONTROL WORKS! Key is fully functional!")
-                    return True, v
-        except Exception as e:
-            print(f"  ❌ Exception: {str(e)[:50]}")
+    # The version reported by the network scan usually works, so try it first
+    if version_hint:
+        versions = [version_hint] + [v for v in versions if v != version_hint]
+    
+    try:
+        # One version at a time: the lamp accepts only a few local sessions, and
+        # overlapping probes can make a valid key look invalid. The short socket
+        # timeout keeps wrong versions from stalling the sweep.
+        for v in versions:
+            works, lines = _probe_version(device_id, device_ip, key, v)
+            _emit(lines)
+            if works:
+                return True, v
+            _drop_device(device_id, device_ip, v, key)
+    finally:
+        # Tuya lamps accept only a few local sessions; don't leave ours open
+        _close_devices()
     
     return False, None
 
 
 def get_device_info_from_network():
     """Get device info from network scan"""
-    print("\n" + "=" * 70)
-    print("🌐 Network Device Information")
-    print("=" * 70)
+    _emit(_banner("🌐 Network Device Information"))
+    
+    device_ip = "YOUR_DEVICE_IP"
     
     try:
-        devices = tinytuya.deviceScan()
+        if hasattr(tinytuya, "find_device"):
+            # Wait only for this device's broadcast instead of enumerating the whole LAN
+            found = tinytuya.find_device(address=device_ip)
+            if found and found.get("ip"):
+                info = dict(found.get("data") or {})
+                info.setdefault("gwId", found.get("id"))
+                info.setdefault("version", found.get("version"))
+                devices = {found["ip"]: info}
+            else:
+                devices = {}
+        else:
+            devices = tinytuya.deviceScan()
         if devices:
             for ip, info in devices.items():
-                if ip == "YOUR_DEVICE_IP":
+                if ip == device_ip:
                     print(f"\n✅ Found your device:")
                     print(f"  IP: {ip}")
                     print(f"  Device ID: {info.get('gwId', 'Unknown')}")
@@ -208,14 +354,8 @@ def get_device_info_from_network():
     return None
 
 
-def show_key_usage_examples(key):
-    """Show how to use the key"""
-    print("\n" + "=" * 70)
-    print("📝 Key Usage Examples")
-    print("=" * 70)
-    
-    print(f"\n1. Basic Control:")
-    print(f"""
+# Usage example templates for show_key_usage_examples
+_USAGE_BASIC = """
 import tinytuya
 
 d = tinytuya.Device("YOUR_DEVICE_ID", "YOUR_DEVICE_IP")
@@ -223,61 +363,95 @@ d.set_version("3.5")
 d.set_key("{key}")
 d.turn_off()
 d.turn_on()
-""")
-    
-    print(f"\n2. In avant_control.py:")
-    print(f"""
+"""
+
+_USAGE_CONFIG = """
 AVANT_KEY = "{key}"
-""")
-    
-    print(f"\n3. Save to file:")
-    print(f"""
+"""
+
+_USAGE_SAVE = """
 with open("key.txt", "w") as f:
     f.write("{key}")
-""")
+"""
+
+
+def show_key_usage_examples(key):
+    """Show how to use the key"""
+    out = _banner("📝 Key Usage Examples")
+    
+    out.append(f"\n1. Basic Control:")
+    out.append(_USAGE_BASIC.format(key=key))
+    
+    out.append(f"\n2. In avant_control.py:")
+    out.append(_USAGE_CONFIG.format(key=key))
+    
+    out.append(f"\n3. Save to file:")
+    out.append(_USAGE_SAVE.format(key=key))
+
+    _emit(out)
+
+def _parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Show everything knowable about the lamp key and device")
+    parser.add_argument("--quiet", action="store_true", help="skip decorative banners")
+    parser.add_argument("--json", action="store_true", help="print only a JSON summary")
+    return parser.parse_args()
 
 
 def main():
     """Main function"""
-    print("\n" + "=" * 70)
-    print("🔑 COMPLETE KEY ANALYSIS")
-    print("=" * 70)
-    print("\nAnalyzing everything knowable about your Avant lamp key...\n")
+    global QUIET
+    args = _parse_args()
+    QUIET = args.quiet or args.json
+    
+    # In JSON mode the section output is discarded and only the summary is printed
+    if args.json:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_analysis()
+        print(json.dumps(result))
+    else:
+        run_analysis()
+
+
+def run_analysis():
+    """Run every analysis step and return the summary"""
+    result = {"source": None, "key": None, "length": 0, "valid": False, "version": None}
+    
+    _emit(_banner("🔑 COMPLETE KEY ANALYSIS"))
+    if not QUIET:
+        print("\nAnalyzing everything knowable about your Avant lamp key...\n")
     
     # Step 1: Load key from files
-    key_sources = load_key_from_files()
+    found = load_key_from_files()
     
-    if not key_sources:
+    if not found:
         print("\n❌ No key found in any files!")
         print("\nYou need to:")
         print("1. Get key from Tuya IoT Platform web interface")
         print("2. Or extract from network packets")
         print("3. Or get from Tuya Smart app")
-        return
+        return result
     
-    # Use first key found
-    source_file = list(key_sources.keys())[0]
-    key = key_sources[source_file]
+    source_file, key = found
     
     print(f"\n✅ Using key from: {source_file}")
     
     # Step 2: Analyze the key
     analyzed_key = analyze_key(key)
     
-    # Step 3: Test with device
-    works, working_version = test_key_with_device(key)
-    
-    # Step 4: Get network info
+    # Step 3: Get network info (the reported version is probed first)
     device_info = get_device_info_from_network()
+    version_hint = device_info.get("version") if device_info else None
+    
+    # Step 4: Test with device
+    works, working_version = test_key_with_device(key, version_hint)
     
     # Step 5: Show usage
     if works:
         show_key_usage_examples(key)
     
     # Summary
-    print("\n" + "=" * 70)
-    print("📋 SUMMARY")
-    print("=" * 70)
+    _emit(_banner("📋 SUMMARY"))
     print(f"\nKey Source: {source_file}")
     print(f"Key Length: {len(key)} characters")
     print(f"Key Valid: {'✅ YES' if works else '❌ NO'}")
@@ -287,7 +461,11 @@ def main():
         print(f"   You can now control your Avant lamp!")
     else:
         print(f"\n⚠️  Key may be invalid or device needs different key")
-    print("=" * 70 + "\n")
+    if not QUIET:
+        print("=" * 70 + "\n")
+    
+    result.update(source=source_file, key=key, length=len(key), valid=works, version=working_version)
+    return result
 
 
 if __name__ == "__main__":
@@ -7,16 +7,32 @@ import os
 import sys
 import subprocess
 import shutil
+import importlib.util
 from pathlib import Path
 
+# (pip package, import name) pairs
+BUILD_REQUIREMENTS = [("pyinstaller", "PyInstaller"), ("tinytuya", "tinytuya")]
+AUDIO_REQUIREMENTS = [("pyaudio", "pyaudio"), ("numpy", "numpy"), ("scipy", "scipy")]
+
+def _missing_packages(requirements):
+    """Return the pip names of requirements that cannot be imported"""
+    return [package for package, module in requirements if importlib.util.find_spec(module) is None]
+
 def install_requirements():
-    """Install required packages for building"""
-    print("Installing build requirements...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller", "tinytuya"])
+    """Install required packages for building (skips pip when already installed)"""
+    missing = _missing_packages(BUILD_REQUIREMENTS)
+    if missing:
+        print("Installing build requirements...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
+    else:
+        print("Build requirements already installed")
     
     # Optional audio dependencies
+    missing = _missing_packages(AUDIO_REQUIREMENTS)
+    if not missing:
+        return
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyaudio", "numpy", "scipy"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
         print("Audio dependencies installed successfully")
     except subprocess.CalledProcessError:
         print("Warning: Audio dependencies could not be installed. Audio features will be disabled.")
@@ -48,6 +64,11 @@ def build_executable():
         "--hidden-import=numpy",  # Optional
         "--hidden-import=scipy",  # Optional
         "--hidden-import=pyaudio",  # Optional
+        # Keep build/ between runs so PyInstaller reuses its analysis (REBUILD_CLEAN=1 forces a full rebuild)
+        "--workpath=build",
+        "--distpath=dist",
+        "--noconfirm",
+        *(["--clean"] if os.environ.get("REBUILD_CLEAN") == "1" else []),
         "main.py"
     ]
     
@@ -61,6 +82,13 @@ def build_executable():
     
     return True
 
+def _fast_copy(src, dst):
+    """Hard-link src to dst when on the same volume, copying only as a fallback"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 def create_portable_package():
     """Create a portable package with executable"""
     dist_dir = Path.cwd() / "dist"
@@ -74,7 +102,8 @@ def create_portable_package():
     # Copy executable
     exe_path = dist_dir / "SmartLampController.exe"
     if exe_path.exists():
-        shutil.copy2(exe_path, portable_dir / "SmartLampController.exe")
+        # The executable is large and never edited in place, so link it instead of copying
+        _fast_copy(exe_path, portable_dir / "SmartLampController.exe")
     
     # Copy essential files
     essential_files = ["README.md", "requirements.txt"]
@@ -7,9 +7,16 @@ import os
 import sys
 import subprocess
 import shutil
+import importlib.metadata
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
+# Python 3.13 support landed in PyInstaller 6.4
+PYINSTALLER_MIN_VERSION = (6, 4)
 
+
+@lru_cache(maxsize=1)
 def _python_exec_override() -> str:
     """Return the Python executable to use for building.
 
@@ -32,10 +39,16 @@ def _python_exec_override() -> str:
     return sys.executable
 
 
+@lru_cache(maxsize=8)
+def _python_version(py_exec: str) -> str:
+    """Return the version string of py_exec (spawns the interpreter once per path)."""
+    return subprocess.check_output([py_exec, "-c", "import sys; print(sys.version.split()[0])"], text=True).strip()
+
+
 def _check_python_version(py_exec: str) -> None:
     """Warn if not using Python 3.13."""
     try:
-        out = subprocess.check_output([py_exec, "-c", "import sys; print(sys.version.split()[0])"], text=True).strip()
+        out = _python_version(py_exec)
         if not out.startswith("3.13"):
             print(f"[Warning] Detected Python {out}. Python 3.13 is recommended for this build.")
             print("          To force Python 3.13 on Windows, you can use the py launcher:")
@@ -45,8 +58,33 @@ def _check_python_version(py_exec: str) -> None:
         print(f"[Info] Could not verify Python version: {e}")
 
 
+def _pyinstaller_version(py_exec: str) -> Optional[str]:
+    """Return the PyInstaller version installed for py_exec, or None if it is missing."""
+    if py_exec == sys.executable:
+        try:
+            return importlib.metadata.version("pyinstaller")
+        except importlib.metadata.PackageNotFoundError:
+            return None
+    try:
+        out = subprocess.check_output(
+            [py_exec, "-c", "import importlib.metadata as m; print(m.version('pyinstaller'))"],
+            text=True, stderr=subprocess.DEVNULL,
+        )
+        return out.strip()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
 def install_pyinstaller(py_exec: str) -> bool:
     """Install PyInstaller using the specified Python interpreter"""
+    # Skip pip entirely when a recent enough PyInstaller is already there
+    installed = _pyinstaller_version(py_exec)
+    if installed:
+        parts = tuple(int(p) for p in installed.split(".")[:2] if p.isdigit())
+        if parts >= PYINSTALLER_MIN_VERSION:
+            print(f"PyInstaller {installed} already installed")
+            return True
+
     print("Installing PyInstaller (into the selected Python environment)...")
     try:
         # Use a recent PyInstaller (3.13 compatibility is in 6.4+)
@@ -59,6 +97,17 @@ def install_pyinstaller(py_exec: str) -> bool:
     return True
 
 
+def _incremental_build_args() -> list:
+    """PyInstaller options that keep build/ between runs so analysis is reused.
+
+    Set REBUILD_CLEAN=1 to discard the cached analysis and rebuild from scratch.
+    """
+    args = ["--workpath=build", "--distpath=dist", "--noconfirm"]
+    if os.environ.get("REBUILD_CLEAN") == "1":
+        args.append("--clean")
+    return args
+
+
 def build_basic_executable(py_exec: str) -> bool:
     """Build executable without optional audio dependencies"""
     print("Building basic executable...")
@@ -72,6 +121,7 @@ def build_basic_executable(py_exec: str) -> bool:
         "--windowed",  # No console window
         "--onefile",   # Single executable
         "--add-data=README.md;.",  # Include README (Windows uses ';')
+        *_incremental_build_args(),
         # Hidden imports are often unnecessary; include minimal set only if needed
         "main.py",
     ]
@@ -85,6 +135,14 @@ def build_basic_executable(py_exec: str) -> bool:
         return False
 
 
+def _fast_copy(src, dst):
+    """Hard-link src to dst when on the same volume, copying only as a fallback"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def create_simple_package():
     """Create a simple package"""
     dist_dir = Path.cwd() / "dist"
@@ -98,7 +156,8 @@ def create_simple_package():
     # Copy executable
     exe_path = dist_dir / "SmartLampController.exe"
     if exe_path.exists():
-        shutil.copy2(exe_path, portable_dir / "SmartLampController.exe")
+        # The executable is large and never edited in place, so link it instead of copying
+        _fast_copy(exe_path, portable_dir / "SmartLampController.exe")
         print(f"Executable copied to: {portable_dir / 'SmartLampController.exe'}")
     
     # Copy essential files
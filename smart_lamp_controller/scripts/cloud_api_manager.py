@@ -3,14 +3,51 @@
 Cloud API Key Manager for Smart Lamp Controller
 Manages Tuya cloud API credentials for persistent access
 """
+import sys
 import json
 import time
+import threading
 import hashlib
 import hmac
 import base64
+import types
 import requests
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Iterable, Mapping, Optional, Tuple, Union
 from urllib.parse import urlencode
+from urllib3.util.retry import Retry
+
+# Optional faster JSON parser/serializer
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# (connect, read) timeout in seconds for cloud API requests
+REQUEST_TIMEOUT = (3.05, 10)
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _dumps_pretty(obj: Any) -> str:
+    """Indented JSON for display"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+@lru_cache(maxsize=1)
+def _load_config(path: str = "lamp_config.json") -> Mapping[str, Any]:
+    """Parsed lamp config, read once and shared read-only (call cache_clear() after writing it)"""
+    with open(path, 'rb') as f:
+        return types.MappingProxyType(_loads(f.read()))
+
+def _canonical_query(params: Dict[str, Any]) -> str:
+    """Sorted, percent-encoded query string used for request signing (as requests sends it)"""
+    return urlencode(sorted(params.items()))
 
 class TuyaCloudAPI:
     """Tuya Cloud API wrapper for persistent device access"""
@@ -21,57 +58,92 @@ class TuyaCloudAPI:
         self.region = region
         self.base_url = f"https://openapi.tuya{region}.com/v2.0"
         self.access_token = None
-        self.token_expires = 0
+        self.token_expires = 0  # time.monotonic() deadline
+        self._token_lock = threading.Lock()
+        
+        # device_id -> (info_path, info_url, status_path, status_url)
+        self._device_endpoints: Dict[str, Tuple[str, str, str, str]] = {}
+        
+        # Headers shared by every signed request; _sign_request adds 't' and 'sign'
+        self._base_headers = {
+            'client_id': client_id,
+            'sign_method': 'HMAC-SHA256',
+            'Content-Type': 'application/json'
+        }
+        
+        # Keyed HMAC state, copied per request so the secret's pads are derived only once
+        self._hmac_template = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+        
+        # One keep-alive session per client so requests reuse the TCP/TLS connection
+        self._session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    
+    def close(self):
+        """Close the pooled HTTP connections"""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
         
-    def _sign_request(self, method: str, path: str, params: Dict[str, Any] = None, body: str = "") -> Dict[str, str]:
+    def _sign_request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                      body: Union[str, bytes] = "") -> Dict[str, str]:
         """Generate signed headers for Tuya API request"""
         timestamp = str(int(time.time() * 1000))
         
-        # Build query string
-        query = ""
-        if params:
-            query = urlencode(sorted(params.items()))
+        # Canonical query string; requests without params skip building one
+        query = _canonical_query(params) if params else ""
         
-        # Build string to sign
-        string_to_sign = f"{method}\n{path}\n{query}\n{body}\n{timestamp}"
+        # Build string to sign directly as bytes (method and timestamp are always ASCII)
+        string_to_sign = b"\n".join((
+            method.encode('ascii'),
+            path.encode('utf-8'),
+            query.encode('utf-8'),
+            body if isinstance(body, bytes) else body.encode('utf-8'),
+            timestamp.encode('ascii'),
+        ))
         
         # Generate signature
-        signature = hmac.new(
-            self.secret.encode('utf-8'),
-            string_to_sign.encode('utf-8'),
-            hashlib.sha256
-        ).digest()
+        mac = self._hmac_template.copy()
+        mac.update(string_to_sign)
+        signature = mac.digest()
         
         sign = base64.b64encode(signature).decode('utf-8')
         
-        return {
-            'client_id': self.client_id,
-            'sign_method': 'HMAC-SHA256',
-            't': timestamp,
-            'sign': sign,
-            'mode': 'cors',
-            'Content-Type': 'application/json'
-        }
+        headers = self._base_headers.copy()
+        headers['t'] = timestamp
+        headers['sign'] = sign
+        return headers
     
     def get_access_token(self) -> Optional[str]:
         """Get or refresh access token"""
         # Check if current token is still valid
-        if self.access_token and time.time() < self.token_expires:
+        if self.access_token and time.monotonic() < self.token_expires:
             return self.access_token
         
-        # Get new token
+        with self._token_lock:
+            # Another thread may have refreshed it while we waited
+            if self.access_token and time.monotonic() < self.token_expires:
+                return self.access_token
+            return self._refresh_access_token()
+    
+    def _refresh_access_token(self) -> Optional[str]:
+        """Request a new access token (caller holds _token_lock)"""
         path = "/token"
         url = f"{self.base_url}{path}"
         
         headers = self._sign_request("GET", path)
         
         try:
-            response = requests.get(url, headers=headers)
-            data = response.json()
+            response = self._session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            data = _loads(response.content)
             
             if data.get('success'):
                 self.access_token = data['result']['access_token']
-                self.token_expires = time.time() + data['result']['expire_time'] - 60  # 1 minute buffer
+                self.token_expires = time.monotonic() + data['result']['expire_time'] - 60  # 1 minute buffer
                 return self.access_token
             else:
                 print(f"Token error: {data.get('msg', 'Unknown error')}")
@@ -81,21 +153,30 @@ class TuyaCloudAPI:
             print(f"Token request failed: {e}")
             return None
     
+    def _endpoints_for(self, device_id: str) -> Tuple[str, str, str, str]:
+        """Signing paths and URLs for a device's info and status endpoints (built once per device)"""
+        endpoints = self._device_endpoints.get(device_id)
+        if endpoints is None:
+            info_path = f"/cloud/thing/{device_id}"
+            status_path = f"{info_path}/status"
+            endpoints = (info_path, f"{self.base_url}{info_path}", status_path, f"{self.base_url}{status_path}")
+            self._device_endpoints[device_id] = endpoints
+        return endpoints
+    
     def get_device_info(self, device_id: str) -> Optional[Dict[str, Any]]:
         """Get device information from cloud API"""
         token = self.get_access_token()
         if not token:
             return None
         
-        path = f"/cloud/thing/{device_id}"
-        url = f"{self.base_url}{path}"
+        path, url, _, _ = self._endpoints_for(device_id)
         
         headers = self._sign_request("GET", path)
         headers['access_token'] = token
         
         try:
-            response = requests.get(url, headers=headers)
-            data = response.json()
+            response = self._session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            data = _loads(response.content)
             
             if data.get('success'):
                 return data['result']
@@ -113,15 +194,14 @@ class TuyaCloudAPI:
         if not token:
             return None
         
-        path = f"/cloud/thing/{device_id}/status"
-        url = f"{self.base_url}{path}"
+        _, _, path, url = self._endpoints_for(device_id)
         
         headers = self._sign_request("GET", path)
         headers['access_token'] = token
         
         try:
-            response = requests.get(url, headers=headers)
-            data = response.json()
+            response = self._session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            data = _loads(response.content)
             
             if data.get('success'):
                 return data['result']
@@ -132,6 +212,32 @@ class TuyaCloudAPI:
         except Exception as e:
             print(f"Device status request failed: {e}")
             return None
+    
+    def get_many(self, device_ids: Iterable[str], kinds: Iterable[str] = ("info", "status")) -> Dict[str, Dict[str, Any]]:
+        """Fetch several kinds of data ("info", "status") for several devices concurrently
+        
+        Returns {device_id: {kind: result or None}}.
+        """
+        fetchers = {"info": self.get_device_info, "status": self.get_device_status}
+        device_ids = list(device_ids)
+        kinds = list(kinds)
+        results = {device_id: dict.fromkeys(kinds) for device_id in device_ids}
+        
+        # Fetch the token up front so the workers share it instead of each requesting one
+        if not self.get_access_token():
+            return results
+        
+        # Requests are network-bound and share the session's connection pool
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = {
+                pool.submit(fetchers[kind], device_id): (device_id, kind)
+                for device_id in device_ids
+                for kind in kinds
+            }
+            for future in as_completed(futures):
+                device_id, kind = futures[future]
+                results[device_id][kind] = future.result()
+        return results
 
 def setup_cloud_credentials():
     """Setup and save Tuya cloud API credentials"""
@@ -164,8 +270,7 @@ def setup_cloud_credentials():
         # Save credentials to config
         config = {}
         try:
-            with open("lamp_config.json", 'r') as f:
-                config = json.load(f)
+            config = dict(_load_config())
         except FileNotFoundError:
             pass
         
@@ -179,6 +284,7 @@ def setup_cloud_credentials():
         
         with open("lamp_config.json", 'w') as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
+        _load_config.cache_clear()
         
         print("✅ Cloud API credentials saved to lamp_config.json")
         
@@ -189,7 +295,7 @@ def setup_cloud_credentials():
             device_info = api.get_device_info(device_id)
             if device_info:
                 print("✅ Device access successful!")
-                print(f"Device info: {json.dumps(device_info, indent=2)}")
+                print(f"Device info: {_dumps_pretty(device_info)}")
             else:
                 print("❌ Failed to access device")
     
@@ -199,8 +305,7 @@ def setup_cloud_credentials():
 def test_cloud_access():
     """Test cloud API access with saved credentials"""
     try:
-        with open("lamp_config.json", 'r') as f:
-            config = json.load(f)
+        config = _load_config()
         
         cloud_config = config.get('cloud_api')
         if not cloud_config or not cloud_config.get('enabled'):
@@ -222,17 +327,18 @@ def test_cloud_access():
         device_id = device_config['id']
         print(f"Device ID: {device_id}")
         
-        # Test device info
-        device_info = api.get_device_info(device_id)
+        # Test device info and status (fetched concurrently)
+        results = api.get_many([device_id])[device_id]
+        device_info = results["info"]
+        device_status = results["status"]
+        
         if device_info:
             print("✅ Device info retrieved:")
-            print(json.dumps(device_info, indent=2))
+            print(_dumps_pretty(device_info))
         
-        # Test device status
-        device_status = api.get_device_status(device_id)
         if device_status:
             print("✅ Device status retrieved:")
-            print(json.dumps(device_status, indent=2))
+            print(_dumps_pretty(device_status))
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -256,8 +362,7 @@ def main():
     
     elif choice == '3':
         try:
-            with open("lamp_config.json", 'r') as f:
-                config = json.load(f)
+            config = _load_config()
             
             cloud_config = config.get('cloud_api')
             device_config = config.get('device')
@@ -275,19 +380,20 @@ def main():
             token = api.get_access_token()
             if token:
                 device_id = device_config['id']
-                path = f"/cloud/thing/{device_id}"
-                url = f"{api.base_url}{path}"
+                path, url, _, _ = api._endpoints_for(device_id)
                 
                 headers = api._sign_request("GET", path)
                 headers['access_token'] = token
                 
-                print("\nGenerated curl command:")
-                print("curl --request GET \\")
-                print(f'  "{url}" \\')
-                for key, value in headers.items():
-                    print(f'  --header "{key}: {value}" \\')
-                print("  --header \"mode: cors\"")
-                print("  --header \"Content-Type: application/json\"")
+                # Write the whole command at once so it can be copied as one block
+                lines = [
+                    "\nGenerated curl command:",
+                    "curl --request GET \\",
+                    f'  "{url}" \\',
+                    *(f'  --header "{key}: {value}" \\' for key, value in headers.items()),
+                    '  --header "Content-Type: application/json"',
+                ]
+                sys.stdout.write("\n".join(lines) + "\n")
             
         except Exception as e:
             print(f"❌ Error: {e}")
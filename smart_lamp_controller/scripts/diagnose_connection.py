@@ -9,119 +9,162 @@ import sys
 import os
 import tinytuya
 import time
+import re
 import json
 
+# Error classes recognised in status error messages (matched against lowercase text)
+_ERROR_KIND_RE = re.compile(r"(?P<auth>key|secret|auth)|(?P<timeout>timeout)|(?P<conn>connection|refused)")
+
+# Per-attempt socket timeout (seconds) for the protocol version sweep
+VERSION_PROBE_TIMEOUT = 2
+
 # Fix Windows console encoding for emojis
-if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+
+
+def _emit(lines):
+    """Write a block of buffered lines to stdout in one call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def _probe_version(lamp_id, lamp_ip, version):
+    """Query status with one protocol version; returns (works, message)"""
+    try:
+        d_test = tinytuya.Device(lamp_id, lamp_ip)
+        d_test.set_version(version)
+        d_test.set_socketTimeout(VERSION_PROBE_TIMEOUT)
+        status = d_test.status()
+        
+        if not status.get("Error") and not status.get("Err"):
+            return True, f"✅ Version {version} works! Status: {status}"
+        return False, f"❌ Version {version} failed: {status.get('Error', status.get('Err'))}"
+    except Exception as e:
+        return False, f"❌ Version {version} exception: {e}"
 
 
 def diagnose_lamp_connection(lamp_ip, lamp_id, version="3.5"):
     """Diagnose connection issues with the lamp"""
     
-    print("=" * 70)
-    print("🔍 LAMP CONNECTION DIAGNOSTIC")
-    print("=" * 70)
-    print(f"Device IP: {lamp_ip}")
-    print(f"Device ID: {lamp_id}")
-    print(f"Protocol Version: {version}")
-    print("=" * 70 + "\n")
+    # Output is collected per test block and written in one call
+    out = []
+    out.append("=" * 70)
+    out.append("🔍 LAMP CONNECTION DIAGNOSTIC")
+    out.append("=" * 70)
+    out.append(f"Device IP: {lamp_ip}")
+    out.append(f"Device ID: {lamp_id}")
+    out.append(f"Protocol Version: {version}")
+    out.append("=" * 70 + "\n")
     
     # Test 1: Basic connection
-    print("TEST 1: Basic Connection Test")
-    print("-" * 70)
+    out.append("TEST 1: Basic Connection Test")
+    out.append("-" * 70)
     try:
         d = tinytuya.Device(lamp_id, lamp_ip)
         d.set_version(version)
-        print("✅ Device object created successfully")
+        out.append("✅ Device object created successfully")
     except Exception as e:
-        print(f"❌ Failed to create device: {e}")
+        out.append(f"❌ Failed to create device: {e}")
+        _emit(out)
         return
+    _emit(out)
     
     # Test 2: Status query
-    print("\nTEST 2: Status Query")
-    print("-" * 70)
+    out = []
+    out.append("\nTEST 2: Status Query")
+    out.append("-" * 70)
     try:
         status = d.status()
-        print(f"Response received: {json.dumps(status, indent=2)}")
+        out.append(f"Response received: {json.dumps(status, indent=2)}")
         
         if "Error" in status or "Err" in status:
             error_msg = status.get("Error") or status.get("Err") or "Unknown error"
-            print(f"\n❌ ERROR DETECTED: {error_msg}")
+            out.append(f"\n❌ ERROR DETECTED: {error_msg}")
             
             # Common error analysis
             error_str = str(error_msg).lower()
+            # One scan for every error class; auth wins over timeout over connection as before
+            error_kinds = {m.lastgroup for m in _ERROR_KIND_RE.finditer(error_str)}
             
-            if "key" in error_str or "secret" in error_str or "auth" in error_str:
-                print("\n🔑 AUTHENTICATION ERROR DETECTED")
-                print("   The device requires a local_key (secret) for authentication.")
-                print("\n   Solutions:")
-                print("   1. Get the local_key from Tuya IoT Platform:")
-                print("      - Go to https://iot.tuya.com/")
-                print("      - Create a project and link your device")
-                print("      - Get the local_key from device details")
-                print("\n   2. Use tinytuya wizard to get the key:")
-                print("      - Run: python -m tinytuya wizard")
-                print("      - Follow the prompts to scan and get keys")
-                print("\n   3. Extract from Tuya Smart app (requires root/jailbreak)")
-                print("\n   4. Try using set_key() method:")
-                print("      d.set_key('your_local_key_here')")
+            if "auth" in error_kinds:
+                out.append("\n🔑 AUTHENTICATION ERROR DETECTED")
+                out.append("   The device requires a local_key (secret) for authentication.")
+                out.append("\n   Solutions:")
+                out.append("   1. Get the local_key from Tuya IoT Platform:")
+                out.append("      - Go to https://iot.tuya.com/")
+                out.append("      - Create a project and link your device")
+                out.append("      - Get the local_key from device details")
+                out.append("\n   2. Use tinytuya wizard to get the key:")
+                out.append("      - Run: python -m tinytuya wizard")
+                out.append("      - Follow the prompts to scan and get keys")
+                out.append("\n   3. Extract from Tuya Smart app (requires root/jailbreak)")
+                out.append("\n   4. Try using set_key() method:")
+                out.append("      d.set_key('your_local_key_here')")
                 
-            elif "timeout" in error_str:
-                print("\n⏱️  TIMEOUT ERROR")
-                print("   The device is not responding in time.")
-                print("\n   Solutions:")
-                print("   1. Check if device is powered on")
-                print("   2. Check network connectivity")
-                print("   3. Try increasing timeout")
+            elif "timeout" in error_kinds:
+                out.append("\n⏱️  TIMEOUT ERROR")
+                out.append("   The device is not responding in time.")
+                out.append("\n   Solutions:")
+                out.append("   1. Check if device is powered on")
+                out.append("   2. Check network connectivity")
+                out.append("   3. Try increasing timeout")
                 
-            elif "connection" in error_str or "refused" in error_str:
-                print("\n🔌 CONNECTION ERROR")
-                print("   Cannot establish connection to device.")
-                print("\n   Solutions:")
-                print("   1. Verify device IP address")
-                print("   2. Check if device is on the same network")
-                print("   3. Check firewall settings")
-                print("   4. Try different protocol version")
+            elif "conn" in error_kinds:
+                out.append("\n🔌 CONNECTION ERROR")
+                out.append("   Cannot establish connection to device.")
+                out.append("\n   Solutions:")
+                out.append("   1. Verify device IP address")
+                out.append("   2. Check if device is on the same network")
+                out.append("   3. Check firewall settings")
+                out.append("   4. Try different protocol version")
                 
             else:
-                print(f"\n⚠️  UNKNOWN ERROR: {error_msg}")
-                print("   Try the solutions below.")
+                out.append(f"\n⚠️  UNKNOWN ERROR: {error_msg}")
+                out.append("   Try the solutions below.")
                 
         else:
-            print("✅ Status query successful!")
-            print("   Device is responding correctly.")
+            out.append("✅ Status query successful!")
+            out.append("   Device is responding correctly.")
             
     except Exception as e:
-        print(f"❌ Status query failed: {e}")
-        print(f"   Exception type: {type(e).__name__}")
+        out.append(f"❌ Status query failed: {e}")
+        out.append(f"   Exception type: {type(e).__name__}")
+    
+    _emit(out)
     
     # Test 3: Try control without key
-    print("\n\nTEST 3: Control Command Test (without local_key)")
-    print("-" * 70)
+    out = []
+    out.append("\n\nTEST 3: Control Command Test (without local_key)")
+    out.append("-" * 70)
     try:
-        print("Attempting to turn lamp OFF...")
+        out.append("Attempting to turn lamp OFF...")
         result = d.turn_off()
-        print(f"Result: {json.dumps(result, indent=2)}")
+        out.append(f"Result: {json.dumps(result, indent=2)}")
         
         if result.get("Error"):
-            print(f"\n❌ Control failed: {result.get('Error')}")
+            out.append(f"\n❌ Control failed: {result.get('Error')}")
         else:
-            print("✅ Control command sent successfully!")
+            out.append("✅ Control command sent successfully!")
+            _emit(out)
+            out = []
             time.sleep(2)
             
-            print("\nAttempting to turn lamp ON...")
+            out.append("\nAttempting to turn lamp ON...")
             result = d.turn_on()
-            print(f"Result: {json.dumps(result, indent=2)}")
+            out.append(f"Result: {json.dumps(result, indent=2)}")
             
     except Exception as e:
-        print(f"❌ Control test failed: {e}")
+        out.append(f"❌ Control test failed: {e}")
+    
+    _emit(out)
     
     # Test 4: Try with different methods
-    print("\n\nTEST 4: Alternative Control Methods")
-    print("-" * 70)
+    out = []
+    out.append("\n\nTEST 4: Alternative Control Methods")
+    out.append("-" * 70)
     
     methods = [
         ("set_value(1, False)", lambda: d.set_value(1, False)),
@@ -131,55 +174,53 @@ def diagnose_lamp_connection(lamp_ip, lamp_id, version="3.5"):
     
     for method_name, method_func in methods:
         try:
-            print(f"\nTrying {method_name}...")
+            out.append(f"\nTrying {method_name}...")
             if method_func:
                 result = method_func()
                 if result and not result.get("Error"):
-                    print(f"✅ {method_name} succeeded!")
+                    out.append(f"✅ {method_name} succeeded!")
                     break
                 elif result:
-                    print(f"❌ {method_name} failed: {result.get('Error', 'Unknown error')}")
+                    out.append(f"❌ {method_name} failed: {result.get('Error', 'Unknown error')}")
         except Exception as e:
-            print(f"❌ {method_name} exception: {e}")
+            out.append(f"❌ {method_name} exception: {e}")
+    _emit(out)
     
     # Test 5: Protocol version test
-    print("\n\nTEST 5: Protocol Version Test")
-    print("-" * 70)
+    out = ["\n\nTEST 5: Protocol Version Test", "-" * 70]
     versions = ["3.1", "3.3", "3.4", "3.5", "auto"]
     
+    _emit(out)
+    
+    # One version at a time: the lamp takes a single local connection, so
+    # parallel probes would knock each other out. The short socket timeout
+    # keeps a wrong version from stalling the sweep.
     for v in versions:
-        try:
-            print(f"\nTrying version {v}...")
-            d_test = tinytuya.Device(lamp_id, lamp_ip)
-            d_test.set_version(v)
-            status = d_test.status()
-            
-            if not status.get("Error") and not status.get("Err"):
-                print(f"✅ Version {v} works! Status: {status}")
-                break
-            else:
-                print(f"❌ Version {v} failed: {status.get('Error', status.get('Err'))}")
-        except Exception as e:
-            print(f"❌ Version {v} exception: {e}")
+        print(f"\nTrying version {v}...")
+        works, message = _probe_version(lamp_id, lamp_ip, v)
+        print(message)
+        if works:
+            break
     
     # Summary and recommendations
-    print("\n\n" + "=" * 70)
-    print("📋 DIAGNOSTIC SUMMARY")
-    print("=" * 70)
-    print("\nMost likely issue: Missing local_key (authentication secret)")
-    print("\nRecommended steps:")
-    print("1. Get your device's local_key using one of these methods:")
-    print("   a) Tuya IoT Platform (https://iot.tuya.com/)")
-    print("   b) tinytuya wizard: python -m tinytuya wizard")
-    print("   c) Extract from Tuya Smart app (advanced)")
-    print("\n2. Once you have the local_key, use it like this:")
-    print("   d = tinytuya.Device(lamp_id, lamp_ip)")
-    print("   d.set_version('3.5')")
-    print("   d.set_key('your_local_key_here')  # <-- Add this line")
-    print("   d.turn_off()")
-    print("\n3. Alternative: Use Tuya Cloud API (requires API credentials)")
-    print("=" * 70)
-
+    out = []
+    out.append("\n\n" + "=" * 70)
+    out.append("📋 DIAGNOSTIC SUMMARY")
+    out.append("=" * 70)
+    out.append("\nMost likely issue: Missing local_key (authentication secret)")
+    out.append("\nRecommended steps:")
+    out.append("1. Get your device's local_key using one of these methods:")
+    out.append("   a) Tuya IoT Platform (https://iot.tuya.com/)")
+    out.append("   b) tinytuya wizard: python -m tinytuya wizard")
+    out.append("   c) Extract from Tuya Smart app (advanced)")
+    out.append("\n2. Once you have the local_key, use it like this:")
+    out.append("   d = tinytuya.Device(lamp_id, lamp_ip)")
+    out.append("   d.set_version('3.5')")
+    out.append("   d.set_key('your_local_key_here')  # <-- Add this line")
+    out.append("   d.turn_off()")
+    out.append("\n3. Alternative: Use Tuya Cloud API (requires API credentials)")
+    out.append("=" * 70)
+    _emit(out)
 
 def main():
     """Main function"""
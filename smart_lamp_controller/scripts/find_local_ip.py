@@ -4,33 +4,72 @@ Find the local IP address of the Tuya lamp
 """
 import tinytuya
 import socket
+import ipaddress
 import subprocess
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Worker threads for the /24 sweep (each probe mostly waits on a socket timeout)
+FULL_SCAN_WORKERS = 64
+
+def _local_ipv4():
+    """Return this machine's LAN IPv4 address, or None if it can't be determined"""
+    # Connecting a UDP socket only picks the outgoing interface; no packets are sent
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        s.connect(("8.8.8.8", 80))
+        return s.getsockname()[0]
+    except OSError:
+        pass
+    finally:
+        s.close()
+    
+    # Offline: fall back to the first non-loopback interface address
+    try:
+        import psutil
+    except ImportError:
+        return None
+    for addrs in psutil.net_if_addrs().values():
+        for addr in addrs:
+            if addr.family == socket.AF_INET and not addr.address.startswith("127."):
+                return addr.address
+    return None
 
 def get_network_range():
     """Get the local network range"""
+    local_ip = _local_ipv4()
+    
+    # Extract network portion (first 3 octets) of the validated /24
     try:
-        # Get local IP and subnet
-        hostname = socket.gethostname()
-        local_ip = socket.gethostbyname(hostname)
-        
-        # Extract network portion (first 3 octets)
-        if '.' in local_ip:
-            parts = local_ip.split('.')
-            network_base = f"{parts[0]}.{parts[1]}.{parts[2]}"
-            return network_base
-        return "192.168.1"  # Default fallback
-        
-    except Exception:
+        net = ipaddress.ip_interface(f"{local_ip}/24").network
+    except ValueError:
         return "192.168.1"  # Default fallback
+    return str(net.network_address).rsplit(".", 1)[0]
+
+def iter_scan_targets(network_base, netmask_bits=24):
+    """Yield every host address of the scan network"""
+    yield from ipaddress.ip_network(f"{network_base}.0/{netmask_bits}", strict=False).hosts()
+
+def _find_single_device(device_id):
+    """Wait for one device's broadcast; returns {ip: info} like deviceScan, or {}"""
+    found = tinytuya.find_device(dev_id=device_id)
+    if not found or not found.get("ip"):
+        return {}
+    info = dict(found.get("data") or {})
+    info.setdefault("gwId", found.get("id"))
+    info.setdefault("version", found.get("version"))
+    return {found["ip"]: info}
 
-def scan_network(network_base):
+def scan_network(network_base, device_id=None):
     """Scan the network for Tuya devices"""
     print(f"Scanning network {network_base}.x for Tuya devices...")
     
-    # Try to discover devices
-    devices = tinytuya.deviceScan()
+    # Try to discover devices; a known ID returns as soon as its broadcast arrives
+    if device_id and hasattr(tinytuya, "find_device"):
+        devices = _find_single_device(device_id)
+    else:
+        devices = tinytuya.deviceScan()
     
     if devices:
         print(f"Found {len(devices)} devices:")
@@ -43,9 +82,10 @@ def scan_network(network_base):
     
     return {}
 
-def test_device_connection(device_id, ip, local_key):
+def test_device_connection(device_id, ip, local_key, verbose=True):
     """Test connection to a specific device"""
-    print(f"Testing connection to {device_id} at {ip}...")
+    if verbose:
+        print(f"Testing connection to {device_id} at {ip}...")
     
     try:
         device = tinytuya.BulbDevice(
@@ -59,17 +99,33 @@ def test_device_connection(device_id, ip, local_key):
         data = device.status()
         
         if 'Error' in str(data):
-            print(f"❌ Connection failed: {data}")
+            if verbose:
+                print(f"❌ Connection failed: {data}")
             return False
         else:
-            print("✅ Connection successful!")
-            print(f"Device status: {data}")
+            if verbose:
+                print("✅ Connection successful!")
+                print(f"Device status: {data}")
             return True
             
     except Exception as e:
-        print(f"❌ Connection failed: {e}")
+        if verbose:
+            print(f"❌ Connection failed: {e}")
         return False
 
+def probe_ips(device_id, ips, local_key, max_workers):
+    """Try all ips concurrently and return the first one the device answers on"""
+    # Every probe builds its own device object, so they can run side by side
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(ips)))
+    try:
+        futures = {pool.submit(test_device_connection, device_id, ip, local_key, False): ip for ip in ips}
+        for future in as_completed(futures):
+            if future.result():
+                return futures[future]
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return None
+
 def main():
     """Main function"""
     device_id = "YOUR_DEVICE_ID"
@@ -82,41 +138,46 @@ def main():
     print(f"Your network appears to be: {network_base}.x")
     
     # Scan for devices
-    devices = scan_network(network_base)
+    devices = scan_network(network_base, device_id)
     
     if not devices:
         print("No devices found via automatic scan.")
-        print("Trying common IP addresses...")
         
-        # Try common IPs
-        common_ips = [
-            f"{network_base}.1",
-            f"{network_base}.10", 
-            f"{network_base}.30",
-            f"{network_base}.100",
-            f"{network_base}.254"
-        ]
+        if "--full" in sys.argv:
+            # Sweep the whole /24
+            print(f"Trying every address in {network_base}.1-254...")
+            candidate_ips = [str(ip) for ip in iter_scan_targets(network_base)]
+            max_workers = FULL_SCAN_WORKERS
+        else:
+            print("Trying common IP addresses (use --full to sweep the whole subnet)...")
+            candidate_ips = [
+                f"{network_base}.1",
+                f"{network_base}.10", 
+                f"{network_base}.30",
+                f"{network_base}.100",
+                f"{network_base}.254"
+            ]
+            max_workers = len(candidate_ips)
         
-        for ip in common_ips:
-            print(f"\nTrying {ip}...")
-            if test_device_connection(device_id, ip, local_key):
-                print(f"\n✅ SUCCESS! Device found at: {ip}")
-                print("Update your lamp_config.json with this IP address.")
-                return ip
+        ip = probe_ips(device_id, candidate_ips, local_key, max_workers)
+        if ip:
+            print(f"\n✅ SUCCESS! Device found at: {ip}")
+            print("Update your lamp_config.json with this IP address.")
+            return ip
         
-        print("\n❌ Could not find device on common IPs.")
+        print("\n❌ Could not find device on the probed IPs.")
         return None
     
     else:
-        # Test each found device
-        for ip, info in devices.items():
-            found_id = info.get('gwId', '')
-            if found_id == device_id:
-                print(f"Found matching device at {ip}!")
-                if test_device_connection(device_id, ip, local_key):
-                    print(f"\n✅ SUCCESS! Device confirmed at: {ip}")
-                    print("Update your lamp_config.json with this IP address.")
-                    return ip
+        # Index the found devices by ID and test the matching one
+        by_id = {info['gwId']: ip for ip, info in devices.items() if 'gwId' in info}
+        ip = by_id.get(device_id)
+        if ip:
+            print(f"Found matching device at {ip}!")
+            if test_device_connection(device_id, ip, local_key):
+                print(f"\n✅ SUCCESS! Device confirmed at: {ip}")
+                print("Update your lamp_config.json with this IP address.")
+                return ip
         
         print("\n❌ Found devices but none matched your device ID.")
         return None
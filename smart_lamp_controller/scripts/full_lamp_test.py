@@ -11,13 +11,13 @@ import time
 import socket
 import requests
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from header_inspector import HeaderInspector
 
 # Fix Windows console encoding for emojis
-if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 try:
     import tinytuya
@@ -87,21 +87,22 @@ class FullLampTest:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=3)
             ping_success = result.returncode == 0
             
-            # Port scan
+            # Port scan (all ports probed at once instead of 2s each in turn)
             common_ports = [80, 443, 6668, 6667, 9999, 1883, 8080]
-            open_ports = []
-            
-            for port in common_ports:
+
+            def _probe(port):
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.settimeout(2)
                 try:
-                    result = sock.connect_ex((self.lamp_ip, port))
-                    if result == 0:
-                        open_ports.append(port)
-                except:
-                    pass
+                    return port, sock.connect_ex((self.lamp_ip, port))
+                except OSError:
+                    return port, -1
                 finally:
                     sock.close()
+
+            with ThreadPoolExecutor(max_workers=len(common_ports)) as pool:
+                results = list(pool.map(_probe, common_ports))
+            open_ports = [port for port, rc in results if rc == 0]
             
             details = {
                 "ping": "OK" if ping_success else "FAILED",
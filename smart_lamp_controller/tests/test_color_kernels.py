@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Parity tests: vectorized / JIT color kernels vs their scalar references
+"""
+
+import colorsys
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("mss")
+
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(_TESTS_DIR, "..", "..")))
+sys.path.insert(0, os.path.abspath(os.path.join(_TESTS_DIR, "..", "core")))
+
+import color_selection_logic as csl
+import screen_color_analyzer as sca
+
+
+def _random_rgb(n=5000, seed=0):
+    """Random colors plus the grays/primaries that hit the HSV edge cases"""
+    rng = np.random.default_rng(seed)
+    edge = np.array([[0, 0, 0], [255, 255, 255], [128, 128, 128],
+                     [255, 0, 0], [0, 255, 0], [0, 0, 255],
+                     [255, 255, 0], [0, 255, 255], [255, 0, 255]])
+    return np.vstack([edge, rng.integers(0, 256, (n, 3))])
+
+
+def _to_hex(rgb):
+    return [sca.rgb_to_hex(*map(int, c)) for c in rgb]
+
+
+def _colorsys_hsv(rgb):
+    return np.array([colorsys.rgb_to_hsv(r / 255, g / 255, b / 255) for r, g, b in rgb.tolist()])
+
+
+def test_rgb_array_to_hsv_matches_colorsys():
+    rgb = _random_rgb()
+    np.testing.assert_array_equal(sca.rgb_array_to_hsv(rgb), _colorsys_hsv(rgb))
+
+
+def test_hex_colors_to_hsv_matches_colorsys():
+    rgb = _random_rgb(seed=1)
+    got = np.array(csl.ColorSelectionLogic().hex_colors_to_hsv(_to_hex(rgb)))
+    np.testing.assert_array_equal(got, _colorsys_hsv(rgb))
+
+
+def test_hex_colors_to_hsv_empty():
+    assert csl.ColorSelectionLogic().hex_colors_to_hsv([]) == []
+
+
+def test_score_breakdown_batch_matches_scalar():
+    rgb = _random_rgb(seed=2)
+    hex_colors = _to_hex(rgb)
+    rng = np.random.default_rng(3)
+    percentages = rng.uniform(0, 40, len(hex_colors)).round(2).tolist()
+
+    batch = sca.calculate_score_breakdown_batch(hex_colors, percentages)
+    for i, (color, pct) in enumerate(zip(hex_colors, percentages)):
+        ref = sca.calculate_score_breakdown(color, pct)
+        assert batch["total"][i] == ref["total"], color
+        assert bool(batch["rejected"][i]) == ref["rejected"], color
+        if ref["hsv"][1] < 0.5:
+            continue  # scalar version stops before scoring the rest
+        assert round(float(batch["sat_score"][i]), 1) == ref["sat_score"], color
+        assert round(float(batch["bri_score"][i]), 1) == ref["bri_score"], color
+        assert round(float(batch["prev_score"][i]), 1) == ref["prev_score"], color
+        assert batch["hue_score"][i] == ref["hue_score"], color
+        assert batch["penalties"][i] == ref["penalties"], color
+
+
+def test_score_breakdown_batch_empty():
+    assert len(sca.calculate_score_breakdown_batch([], [])["total"]) == 0
+
+
+def _bincount_reference(pixels):
+    q = pixels.astype(np.intp) >> 5
+    return np.bincount((q[:, 0] << 6) | (q[:, 1] << 3) | q[:, 2], minlength=csl.HISTOGRAM_BINS)
+
+
+@pytest.mark.parametrize("n", [0, 1, 7, 19200])
+def test_quantized_color_histogram_matches_bincount(n, monkeypatch):
+    pixels = np.random.default_rng(n).integers(0, 256, (n, 3), dtype=np.uint8)
+    expected = _bincount_reference(pixels)
+
+    np.testing.assert_array_equal(csl.quantized_color_histogram(pixels), expected)
+
+    # NumPy fallback, whichever path the import picked
+    monkeypatch.setattr(csl, "NUMBA_AVAILABLE", False)
+    np.testing.assert_array_equal(csl.quantized_color_histogram(pixels), expected)
+
+
+@pytest.mark.skipif(not csl.NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("n_tiles", [1, 3, 8])
+def test_color_histogram_jit_matches_bincount(n_tiles):
+    pixels = np.random.default_rng(n_tiles).integers(0, 256, (10007, 3), dtype=np.uint8)
+    np.testing.assert_array_equal(csl._color_histogram_jit(pixels, n_tiles), _bincount_reference(pixels))
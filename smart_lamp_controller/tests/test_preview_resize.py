@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the screen color analyzer preview resizing (cykooz.resizer vs Pillow)
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("mss")
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+import screen_color_analyzer as sca
+
+App = sca.ScreenColorAnalyzerApp
+
+
+def _random_frame(w=320, h=180, seed=0):
+    """Opaque BGRA frame like the ones mss returns"""
+    rng = np.random.default_rng(seed)
+    frame = rng.integers(0, 256, (h, w, 4), dtype=np.uint8)
+    frame[..., 3] = 255
+    return np.ascontiguousarray(frame)
+
+
+def _pillow_resize(frame, new_w, new_h):
+    h, w = frame.shape[:2]
+    img = Image.frombuffer("RGB", (w, h), frame, "raw", "BGRX", 0, 1)
+    return img.resize((new_w, new_h), Image.BILINEAR)
+
+
+@pytest.mark.skipif(not sca.RESIZER_AVAILABLE, reason="cykooz.resizer not installed")
+def test_fast_resize_matches_pillow():
+    frame = _random_frame()
+    app = SimpleNamespace(_resizer=sca.Resizer(), _resize_dst=None)
+
+    fast = App._fast_resize(app, frame, 200, 112)
+    ref = _pillow_resize(frame, 200, 112)
+
+    assert fast.size == ref.size
+    diff = np.abs(np.asarray(fast, dtype=int) - np.asarray(ref, dtype=int))
+    assert diff.max() <= 2
+
+
+def test_broken_resizer_falls_back_to_pillow():
+    frame = _random_frame()
+
+    def broken(*args):
+        raise TypeError("unexpected keyword argument 'use_alpha'")
+
+    app = SimpleNamespace(_resizer=object(), _fast_resize=broken)
+    img, _, _, _, scale = App._prepare_preview_image(app, frame, 160, 90, 0.0)
+
+    assert app._resizer is None
+    assert img.size == (160, 90)
+    assert scale == 0.5
+    # Exact 2x downscale: the Pillow path is a single box reduce
+    ref = Image.frombuffer("RGB", (320, 180), frame, "raw", "BGRX", 0, 1).reduce(2)
+    assert img.tobytes() == ref.tobytes()